@@ -11,6 +11,7 @@ Usage:
 
 import json
 import os
+import threading
 import webbrowser
 from pathlib import Path
 from google_auth_oauthlib.flow import Flow
@@ -136,12 +137,10 @@ def main():
         print(f"🌐 Authorization URL: {auth_url}")
         print()
         
-        # Try to open browser automatically
-        try:
-            webbrowser.open(auth_url)
-            print("✅ Browser opened automatically!")
-        except Exception:
-            print("⚠️  Could not open browser automatically.")
+        # Open the browser in the background so the code prompt appears right away,
+        # even while the system browser is still starting
+        threading.Thread(target=webbrowser.open, args=(auth_url,), daemon=True).start()
+        print("🌐 Opening your browser... If it doesn't open, visit the URL above.")
         
         print("📋 Please:")
         print("1. Complete the authorization in your browser")
@@ -1,11 +1,24 @@
 from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import asyncio
+import functools
+import itertools
 import json
+import operator
+import random
+import re
+import string
+import tempfile
+import threading
+import time
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import Flow
-import webbrowser
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from dotenv import load_dotenv
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
+from google_auth_httplib2 import AuthorizedHttp
 from google.auth.transport.requests import Request
 
 load_dotenv()
@@ -33,13 +46,16 @@ CREDENTIALS_FILE = None
 TOKEN_FILE = None
 creds = None
 
+# (path, mtime) of the token file creds was last loaded from, so unchanged tokens aren't parsed again
+_token_file_state = None
+
 # For MCP server mode, suppress all credential errors to avoid breaking the protocol
 # Only show errors when running standalone
 SHOW_CREDENTIAL_ERRORS = False  # Always suppress for MCP compatibility
 
 def load_credentials():
     """Load credentials from environment variables"""
-    global CLIENT_ID, CLIENT_SECRET, REDIRECT_URI, CREDENTIALS_FILE, TOKEN_FILE, creds
+    global CLIENT_ID, CLIENT_SECRET, REDIRECT_URI, CREDENTIALS_FILE, TOKEN_FILE, creds, _token_file_state
     
     # Get fresh environment variables (in case they were updated)
     current_creds_path = os.getenv('GSHEETS_CREDENTIALS_PATH')
@@ -88,15 +104,20 @@ def load_credentials():
         TOKEN_FILE = Path(current_token_path)
         
         if TOKEN_FILE.exists():
-            try:
-                token_data = json.loads(TOKEN_FILE.read_text())
-                creds = Credentials.from_authorized_user_info(token_data, SCOPES)
-            except Exception as e:
-                if SHOW_CREDENTIAL_ERRORS:
-                    sys.stderr.write(f"Error loading token from {current_token_path}: {e}\n")
-                    sys.stderr.write("Token file may be corrupted. Please re-authenticate.\n")
-                creds = None
+            # Only read and parse the token again if the file changed since it was last loaded
+            token_file_state = (TOKEN_FILE, TOKEN_FILE.stat().st_mtime_ns)
+            if token_file_state != _token_file_state:
+                _token_file_state = token_file_state
+                try:
+                    token_data = json.loads(TOKEN_FILE.read_bytes())
+                    creds = Credentials.from_authorized_user_info(token_data, SCOPES)
+                except Exception as e:
+                    if SHOW_CREDENTIAL_ERRORS:
+                        sys.stderr.write(f"Error loading token from {current_token_path}: {e}\n")
+                        sys.stderr.write("Token file may be corrupted. Please re-authenticate.\n")
+                    creds = None
         else:
+            _token_file_state = None
             creds = None
 
 
@@ -117,30 +138,234 @@ def get_auth_error_response():
         ]
     }
 
+def save_token():
+    """Write the current credentials back to the token file, replacing it atomically"""
+    global _token_file_state
+    
+    if not creds or not TOKEN_FILE:
+        return
+    
+    try:
+        # Write to a temporary file next to the token so a crash never leaves a truncated token behind
+        with tempfile.NamedTemporaryFile('w', dir=TOKEN_FILE.parent, prefix=TOKEN_FILE.name, suffix='.tmp', delete=False) as f:
+            f.write(creds.to_json())
+        os.replace(f.name, TOKEN_FILE)
+        # creds already matches the new file, so load_credentials doesn't need to parse it
+        _token_file_state = (TOKEN_FILE, TOKEN_FILE.stat().st_mtime_ns)
+    except Exception as e:
+        if SHOW_CREDENTIAL_ERRORS:
+            sys.stderr.write(f"Error saving refreshed token to {TOKEN_FILE}: {e}\n")
+
 def check_credentials():
     """Check if credentials are available and valid"""
     global creds, CLIENT_ID, CLIENT_SECRET, REDIRECT_URI
     
-    # Try to reload credentials from environment variables if not already loaded
-    if not CLIENT_ID or not CLIENT_SECRET or not REDIRECT_URI:
+    # Try to reload credentials from environment variables if not already loaded,
+    # or if the token has not been created yet (e.g. authenticate.py ran after startup)
+    if not CLIENT_ID or not CLIENT_SECRET or not REDIRECT_URI or not creds:
         load_credentials()
     
     # Check if credentials are available
     if not CLIENT_ID or not CLIENT_SECRET or not REDIRECT_URI:
         return False, "Missing credentials configuration"
     
-    # Check if we have valid credentials
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            try:
-                creds.refresh(Request())
-                return True, None
-            except Exception as e:
-                return False, f"Token refresh failed: {str(e)}"
-        else:
-            return False, "Authentication required"
+    # Valid credentials are used from memory, without touching the token file
+    if creds and creds.valid:
+        return True, None
+    
+    if creds and creds.expired and creds.refresh_token:
+        try:
+            creds.refresh(Request())
+        except Exception as e:
+            return False, f"Token refresh failed: {str(e)}"
+        # Persist the new access token so a restarted server doesn't have to refresh again
+        save_token()
+        return True, None
+    
+    return False, "Authentication required"
+
+
+def _authorized_http():
+    """Return a new HTTP client that authorizes requests with the current credentials"""
+    return AuthorizedHttp(creds, http=build_http())
+
+
+# API service clients built by get_service, keyed by (api, version)
+_service_cache = {}
+
+def get_service(api: str, version: str):
+    """Return a Google API service client, reusing it while the credentials object is unchanged"""
+    cached = _service_cache.get((api, version))
+    if cached is not None and cached[0] is creds:
+        return cached[1]
+    
+    # Credentials were (re)loaded, so build a client bound to the new object.
+    # The discovery document comes from the copy packaged with googleapiclient, not the network.
+    service = build(api, version, http=_authorized_http(), cache_discovery=False, static_discovery=True)
+    _service_cache[(api, version)] = (creds, service)
+    return service
+
+
+# Worker threads that execute API requests for _execute, each with its own HTTP client.
+# The pool bounds how many requests are in flight at once.
+_API_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix='google-api')
+_thread_state = threading.local()
+
+def _execute_in_thread(request):
+    """Execute an API request on the calling worker thread's own authorized HTTP client.
+    
+    httplib2 connections are not thread-safe, so requests run in worker threads must not
+    share the client owned by the cached service. Each thread keeps its client (and its
+    open connections) until the credentials object is replaced.
+    """
+    cached = getattr(_thread_state, 'http', None)
+    if cached is None or cached[0] is not creds:
+        cached = (creds, _authorized_http())
+        _thread_state.http = cached
+    return request.execute(http=cached[1])
+
+
+# Retries of requests that were rate limited (429) or hit a transient server error
+_RETRY_MAX_ATTEMPTS = 5
+_RETRY_SERVER_ERRORS = (500, 502, 503, 504)
+_RETRY_BASE_DELAY = 0.3
+
+def _retry_delay(error: Exception, request, attempt: int) -> float | None:
+    """Seconds to wait before retrying a failed API request, or None if it should not be retried.
+    
+    Server errors are only retried for GET requests, since a failed write may already have been
+    applied. A numeric Retry-After header is honoured; otherwise the delay backs off exponentially.
+    """
+    resp = getattr(error, 'resp', None)
+    status = getattr(resp, 'status', None)
+    if attempt + 1 >= _RETRY_MAX_ATTEMPTS:
+        return None
+    if status != 429 and not (status in _RETRY_SERVER_ERRORS and request.method == 'GET'):
+        return None
+    retry_after = str(resp.get('retry-after', ''))
+    if retry_after.isdigit():
+        return float(retry_after)
+    return _RETRY_BASE_DELAY * 2 ** attempt * random.uniform(1, 1.5)
+
+
+async def _execute(request):
+    """Execute an API request in a worker thread so the event loop stays free for other tool calls.
+    
+    Retries wait on the event loop, so a backing-off request doesn't hold a worker thread.
+    """
+    loop = asyncio.get_running_loop()
+    attempt = 0
+    while True:
+        try:
+            return await loop.run_in_executor(_API_EXECUTOR, _execute_in_thread, request)
+        except Exception as e:
+            delay = _retry_delay(e, request, attempt)
+            if delay is None:
+                raise
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def _execute_concurrently(*requests, return_exceptions: bool = False) -> list:
+    """Execute API requests concurrently in worker threads"""
+    return await asyncio.gather(*map(_execute, requests), return_exceptions=return_exceptions)
+
+
+# Spreadsheet titles and sheet lists fetched recently, keyed by spreadsheet ID and evicted
+# least recently used first. Tools that add, delete or rename sheets or spreadsheets invalidate
+# their entry, and the whole cache is dropped when the credentials object changes.
+_SPREADSHEET_META_CACHE: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+_SPREADSHEET_META_MAX_SIZE = 256
+_SPREADSHEET_META_TTL = 30.0
+_SPREADSHEET_META_FIELDS = 'properties.title,sheets.properties(sheetId,title)'
+_spreadsheet_meta_creds = None
+
+async def _get_spreadsheet_metas(service, *spreadsheet_ids: str) -> list:
+    """Return the title and sheet list of each spreadsheet, fetching uncached ones concurrently.
     
-    return True, None
+    A failed fetch is returned as its exception in place of the metadata.
+    """
+    global _spreadsheet_meta_creds
+    if _spreadsheet_meta_creds is not creds:
+        # Entries fetched under other credentials may not be visible to the current ones
+        _SPREADSHEET_META_CACHE.clear()
+        _spreadsheet_meta_creds = creds
+    
+    now = time.monotonic()
+    metas = {}
+    for spreadsheet_id in spreadsheet_ids:
+        cached = _SPREADSHEET_META_CACHE.get(spreadsheet_id)
+        if cached is None:
+            continue
+        if now - cached[0] < _SPREADSHEET_META_TTL:
+            metas[spreadsheet_id] = cached[1]
+            _SPREADSHEET_META_CACHE.move_to_end(spreadsheet_id)
+        else:
+            del _SPREADSHEET_META_CACHE[spreadsheet_id]
+    
+    missing = [spreadsheet_id for spreadsheet_id in dict.fromkeys(spreadsheet_ids) if spreadsheet_id not in metas]
+    fetched = await _execute_concurrently(
+        *(service.spreadsheets().get(spreadsheetId=spreadsheet_id, fields=_SPREADSHEET_META_FIELDS) for spreadsheet_id in missing),
+        return_exceptions=True
+    )
+    for spreadsheet_id, meta in zip(missing, fetched):
+        metas[spreadsheet_id] = meta
+        if not isinstance(meta, Exception):
+            _SPREADSHEET_META_CACHE[spreadsheet_id] = (now, meta)
+            if len(_SPREADSHEET_META_CACHE) > _SPREADSHEET_META_MAX_SIZE:
+                _SPREADSHEET_META_CACHE.popitem(last=False)
+    
+    return [metas[spreadsheet_id] for spreadsheet_id in spreadsheet_ids]
+
+
+async def _get_spreadsheet_title(service, spreadsheet_id: str) -> str:
+    """Return a spreadsheet's title through the metadata cache, or 'Unknown' if it can't be fetched"""
+    (meta,) = await _get_spreadsheet_metas(service, spreadsheet_id)
+    if isinstance(meta, Exception):
+        return 'Unknown'
+    return meta.get('properties', {}).get('title', 'Unknown')
+
+
+def _is_not_found(error: Exception) -> bool:
+    """Whether an API error is a 404, i.e. the spreadsheet doesn't exist or isn't accessible"""
+    return getattr(getattr(error, 'resp', None), 'status', None) == 404
+
+
+def _invalidate_spreadsheet_meta(spreadsheet_id: str) -> None:
+    """Drop the cached title and sheet list of a spreadsheet after it changes"""
+    _SPREADSHEET_META_CACHE.pop(spreadsheet_id, None)
+
+
+# Timestamps in the format returned by the Drive API
+_RFC3339_RE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})')
+
+def _format_timestamp(timestamp: str) -> str:
+    """Format an RFC 3339 timestamp from the Drive API as 'YYYY-MM-DD HH:MM:SS'"""
+    # Drive timestamps already carry the date and time in the first 19 characters
+    if _RFC3339_RE.fullmatch(timestamp):
+        return timestamp[:10] + ' ' + timestamp[11:19]
+    return _parse_timestamp(timestamp)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp: str) -> str:
+    """Fallback for _format_timestamp on timestamps that are not plain RFC 3339"""
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M:%S')
+    except Exception:
+        return timestamp
+
+
+# Size units indexed by (bit_length - 1) // 10, i.e. by power of 1024
+_SIZE_UNITS = (("B", 1), ("KB", 1024), ("MB", 1024 * 1024))
+
+def _format_size(size_bytes: int) -> str:
+    """Format a byte count as B, KB or MB"""
+    unit_index = min(len(_SIZE_UNITS) - 1, max(0, (size_bytes.bit_length() - 1) // 10))
+    if unit_index == 0:
+        return f"{size_bytes} B"
+    unit, divisor = _SIZE_UNITS[unit_index]
+    return f"{size_bytes / divisor:.1f} {unit}"
 
 
 @simple_mcp.tool()
@@ -171,8 +396,8 @@ async def list_sheets(max_results: int = 50, page_token: str | None = None) -> d
         }
     
     try:
-        # Build the Drive service
-        service = build('drive', 'v3', credentials=creds)
+        # Get the Drive service
+        service = get_service('drive', 'v3')
         
         # Prepare the request parameters
         request_params = {
@@ -225,31 +450,15 @@ async def list_sheets(max_results: int = 50, page_token: str | None = None) -> d
             
             # Add human-readable dates
             if sheet_info['created_time']:
-                try:
-                    from datetime import datetime
-                    created_dt = datetime.fromisoformat(sheet_info['created_time'].replace('Z', '+00:00'))
-                    sheet_info['created_date'] = created_dt.strftime('%Y-%m-%d %H:%M:%S')
-                except:
-                    sheet_info['created_date'] = sheet_info['created_time']
+                sheet_info['created_date'] = _format_timestamp(sheet_info['created_time'])
             
             if sheet_info['modified_time']:
-                try:
-                    from datetime import datetime
-                    modified_dt = datetime.fromisoformat(sheet_info['modified_time'].replace('Z', '+00:00'))
-                    sheet_info['modified_date'] = modified_dt.strftime('%Y-%m-%d %H:%M:%S')
-                except:
-                    sheet_info['modified_date'] = sheet_info['modified_time']
+                sheet_info['modified_date'] = _format_timestamp(sheet_info['modified_time'])
             
             # Add size in human-readable format
             if sheet_info['size'] != '0':
                 try:
-                    size_bytes = int(sheet_info['size'])
-                    if size_bytes < 1024:
-                        sheet_info['size_formatted'] = f"{size_bytes} B"
-                    elif size_bytes < 1024 * 1024:
-                        sheet_info['size_formatted'] = f"{size_bytes / 1024:.1f} KB"
-                    else:
-                        sheet_info['size_formatted'] = f"{size_bytes / (1024 * 1024):.1f} MB"
+                    sheet_info['size_formatted'] = _format_size(int(sheet_info['size']))
                 except:
                     sheet_info['size_formatted'] = sheet_info['size']
             else:
@@ -309,8 +518,8 @@ async def add_worksheet(spreadsheet_id: str, title: str, row_count: int = 1000,
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # Prepare the request body for adding a new sheet
         request_body = {
@@ -332,6 +541,7 @@ async def add_worksheet(spreadsheet_id: str, title: str, row_count: int = 1000,
             spreadsheetId=spreadsheet_id,
             body=request_body
         ).execute()
+        _invalidate_spreadsheet_meta(spreadsheet_id)
         
         # Get the new sheet ID from the response
         new_sheet_id = response['replies'][0]['addSheet']['properties']['sheetId']
@@ -381,8 +591,8 @@ async def append_dimension(spreadsheet_id: str, sheet_id: int, dimension: str, l
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # Prepare the request body for appending dimensions
         request_body = {
@@ -439,8 +649,8 @@ async def get_cell_data(spreadsheet_id: str, ranges: list[str]) -> dict:
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # First, verify the spreadsheet exists and get its metadata
         try:
@@ -539,8 +749,8 @@ async def update_sheet_data(spreadsheet_id: str, values: list[list], sheet_name:
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # First, verify the spreadsheet exists and get its metadata
         try:
@@ -664,8 +874,8 @@ async def batch_update_by_filter(spreadsheet_id: str, sheet_name: str, filter_co
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # First, verify the spreadsheet exists and get its metadata
         try:
@@ -852,6 +1062,7 @@ async def batch_update_by_filter(spreadsheet_id: str, sheet_name: str, filter_co
 @simple_mcp.tool()
 async def clear_basic_filter(spreadsheet_id: str, sheet_name: str) -> dict:
     """Tool to clear the basic filter from a sheet. Use when you need to remove an existing basic filter from a specific sheet within a Google spreadsheet.
+    While a batch is open for the spreadsheet (see begin_batch), the change is queued until commit_batch.
     
     Args:
         spreadsheet_id: The ID of the Google Sheet (found in the URL)
@@ -869,8 +1080,8 @@ async def clear_basic_filter(spreadsheet_id: str, sheet_name: str) -> dict:
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # First, verify the spreadsheet exists and get its metadata
         try:
@@ -912,6 +1123,18 @@ async def clear_basic_filter(spreadsheet_id: str, sheet_name: str) -> dict:
         # Get the sheet ID
         sheet_id = target_sheet['properties']['sheetId']
         
+        # Queue the request instead of sending it if a batch is open
+        batch_size = _queue_batch_request(spreadsheet_id, {'clearBasicFilter': {'sheetId': sheet_id}})
+        if batch_size is not None:
+            return {
+                "successful": True,
+                "message": f"Queued clearing the basic filter from sheet '{sheet_name}' ({batch_size} request(s) pending); call commit_batch to apply",
+                "sheet_name": sheet_name,
+                "sheet_id": sheet_id,
+                "queued": True,
+                "batch_size": batch_size
+            }
+        
         # Clear the basic filter from the sheet
         try:
             response = service.spreadsheets().batchUpdate(
@@ -987,8 +1210,8 @@ async def clear_spreadsheet_values(spreadsheet_id: str, range: str) -> dict:
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # First, verify the spreadsheet exists and get its metadata
         try:
@@ -1113,8 +1336,8 @@ async def create_chart(spreadsheet_id: str, sheet_name: str, chart_title: str, d
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # First, verify the spreadsheet exists and get its metadata
         try:
@@ -1404,8 +1627,8 @@ async def create_google_sheet(title: str) -> dict:
         }
     
     try:
-        # Build the Drive service
-        service = build('drive', 'v3', credentials=creds)
+        # Get the Drive service
+        service = get_service('drive', 'v3')
         
         # Create the new spreadsheet
         file_metadata = {
@@ -1473,8 +1696,8 @@ async def create_spreadsheet_column(spreadsheet_id: str, sheet_id: int, insert_i
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # First, verify the spreadsheet exists and get its metadata
         try:
@@ -1591,8 +1814,8 @@ async def create_spreadsheet_row(spreadsheet_id: str, sheet_id: int, insert_inde
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # First, verify the spreadsheet exists and get its metadata
         try:
@@ -1749,8 +1972,8 @@ async def delete_dimension(spreadsheet_id: str, sheet_id: int, dimension: str, s
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # First, verify the spreadsheet exists and get its metadata
         try:
@@ -1882,8 +2105,8 @@ async def delete_spreadsheet(spreadsheet_id: str) -> dict:
         }
     
     try:
-        # Build the Drive service
-        service = build('drive', 'v3', credentials=creds)
+        # Get the Drive service
+        service = get_service('drive', 'v3')
         
         # First, verify the spreadsheet exists and get its metadata
         try:
@@ -1923,6 +2146,7 @@ async def delete_spreadsheet(spreadsheet_id: str) -> dict:
         
         # Delete the spreadsheet
         service.files().delete(fileId=spreadsheet_id).execute()
+        _invalidate_spreadsheet_meta(spreadsheet_id)
         
         return {
             "successful": True,
@@ -1967,8 +2191,8 @@ async def delete_sheet(spreadsheet_id: str, sheet_id: int) -> dict:
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # First, verify the spreadsheet exists and get its metadata
         try:
@@ -2029,6 +2253,7 @@ async def delete_sheet(spreadsheet_id: str, sheet_id: int) -> dict:
                 'requests': [delete_request]
             }
         ).execute()
+        _invalidate_spreadsheet_meta(spreadsheet_id)
         
         return {
             "successful": True,
@@ -2090,8 +2315,8 @@ async def find_worksheet_by_title(spreadsheet_id: str, title: str) -> dict:
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # Get the complete spreadsheet metadata
         try:
@@ -2249,8 +2474,8 @@ async def format_cell(spreadsheet_id: str, worksheet_id: int, start_row_index: i
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # First, verify the spreadsheet exists and get its metadata
         try:
@@ -2378,8 +2603,8 @@ async def get_sheet_names(spreadsheet_id: str) -> dict:
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # Get the spreadsheet metadata
         try:
@@ -2498,8 +2723,8 @@ async def get_spreadsheet_by_data_filter(spreadsheet_id: str, data_filters: list
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # Convert A1 notation filters to proper DataFilter objects
         processed_filters = []
@@ -2661,8 +2886,8 @@ async def get_spreadsheet_info(spreadsheet_id: str) -> dict:
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # Get the spreadsheet metadata (excluding cell data)
         try:
@@ -2817,8 +3042,8 @@ async def get_table_schema(spreadsheet_id: str, table_name: str, sheet_name: str
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # First, get spreadsheet metadata to find sheets
         try:
@@ -2951,7 +3176,7 @@ async def get_table_schema(spreadsheet_id: str, table_name: str, sheet_name: str
             
             schema.append({
                 "column_index": i,
-                "column_letter": chr(65 + i),  # A, B, C, etc.
+                "column_letter": _COLUMN_LETTERS[i],  # A, B, C, etc.
                 "original_name": original_header,
                 "name": cleaned_header,
                 "data_type": data_type,
@@ -2977,8 +3202,8 @@ async def get_table_schema(spreadsheet_id: str, table_name: str, sheet_name: str
             "start_row": table_start_row + 1,  # 1-based for user display
             "end_row": table_start_row + total_rows,
             "start_column": "A",
-            "end_column": chr(64 + total_columns),  # A, B, C, etc.
-            "range": f"'{sheet_title}'!A{table_start_row + 1}:{chr(64 + total_columns)}{table_start_row + total_rows}"
+            "end_column": _COLUMN_LETTERS[total_columns - 1],  # A, B, C, etc.
+            "range": f"'{sheet_title}'!A{table_start_row + 1}:{_COLUMN_LETTERS[total_columns - 1]}{table_start_row + total_rows}"
         }
         
         return {
@@ -3019,7 +3244,119 @@ def _clean_column_name(column_name: str) -> str:
     return column_name.strip().strip('\n\r\t')
 
 
+# Column letters A..ZZ, covering the A:ZZ ranges read for table analysis
+_COLUMN_LETTERS = list(string.ascii_uppercase) + [
+    first + second for first in string.ascii_uppercase for second in string.ascii_uppercase
+]
+
+def _column_letter(col_idx: int) -> str:
+    """Convert a 0-based column index to A1 column letters (0 -> A, 26 -> AA)."""
+    if col_idx < len(_COLUMN_LETTERS):
+        return _COLUMN_LETTERS[col_idx]
+    
+    # Columns past ZZ are only reachable through explicit user ranges
+    letters = ''
+    col_number = col_idx + 1
+    while col_number:
+        col_number, remainder = divmod(col_number - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+# Characters stripped from and allowed in values considered for numeric inference
+_NUMERIC_STRIP = str.maketrans('', '', ',$%')
+_NUMERIC_CHARS = frozenset('0123456789.+-eE_ \t\n\r')
+
+_BOOLEAN_VALUES = frozenset({'true', 'false', 'yes', 'no', '1', '0', 't', 'f', 'y', 'n'})
+
+# Columns longer than the threshold are type-inferred from a sample of
+# head + random middle + tail values
+_INFER_SAMPLE_THRESHOLD = 1024
+_INFER_SAMPLE_EDGE = 256
+_INFER_SAMPLE_MIDDLE = 512
+
+# Cache of inferred column types keyed by (column_name, len(values), hash of the values), evicted
+# FIFO. Only the fingerprint is kept, so an entry's size doesn't grow with the column.
+_INFER_CACHE: OrderedDict[tuple, tuple[str, dict]] = OrderedDict()
+_INFER_CACHE_MAX_SIZE = 1024
+
+
 def _infer_column_type(values: list, column_name: str) -> tuple[str, dict]:
+    """Infer the data type of a column based on its values, reusing cached results.
+    
+    Args:
+        values: List of values in the column
+        column_name: Name of the column for context
+    
+    Returns:
+        Tuple of (data_type, constraints)
+    """
+    try:
+        cache_key = (column_name, len(values), hash(tuple(values)))
+    except TypeError:
+        # Unhashable cell values, skip the cache
+        return _compute_column_type(values, column_name)
+    
+    cached = _INFER_CACHE.get(cache_key)
+    if cached is None:
+        cached = _compute_column_type(values, column_name)
+        _INFER_CACHE[cache_key] = cached
+        if len(_INFER_CACHE) > _INFER_CACHE_MAX_SIZE:
+            _INFER_CACHE.popitem(last=False)
+    
+    # Copy the categories/possible_values lists too, so callers can't change the cached entry
+    data_type, constraints = cached
+    return data_type, {key: list(value) if isinstance(value, list) else value for key, value in constraints.items()}
+
+
+def _sample_column_values(values: list) -> list:
+    """Return a deterministic sample of a long column for type inference.
+    
+    Columns longer than _INFER_SAMPLE_THRESHOLD are reduced to their head, tail and a
+    seeded random selection from the middle; shorter columns are returned unchanged.
+    """
+    if len(values) <= _INFER_SAMPLE_THRESHOLD:
+        return values
+    
+    edge = _INFER_SAMPLE_EDGE
+    middle = random.Random(0).sample(values[edge:-edge], _INFER_SAMPLE_MIDDLE)
+    return values[:edge] + middle + values[-edge:]
+
+
+def _infer_numeric_type(non_empty_values: list) -> tuple[str, dict] | None:
+    """Return the integer/float type of a column if at least 90% of its values are numeric.
+    
+    Args:
+        non_empty_values: List of non-empty values in the column
+    
+    Returns:
+        Tuple of (data_type, constraints), or None if the column is not numeric
+    """
+    numeric_count = 0
+    float_count = 0
+    for value in non_empty_values:
+        value_str = str(value).translate(_NUMERIC_STRIP)
+        # Reject obviously non-numeric values before paying for float()
+        if not value_str or not _NUMERIC_CHARS.issuperset(value_str):
+            continue
+        try:
+            float_val = float(value_str)
+            numeric_count += 1
+            if float_val != int(float_val):
+                float_count += 1
+        except ValueError:
+            pass
+    
+    if numeric_count >= len(non_empty_values) * 0.9:  # 90% numeric
+        if float_count > 0:
+            return "float", {"precision": "decimal"}
+        else:
+            return "integer", {"precision": "whole_number"}
+    
+    return None
+
+
+def _compute_column_type(values: list, column_name: str) -> tuple[str, dict]:
     """Infer the data type of a column based on its values.
     
     Args:
@@ -3037,10 +3374,29 @@ def _infer_column_type(values: list, column_name: str) -> tuple[str, dict]:
     if not non_empty_values:
         return "string", {}
     
-    # Check for boolean values
-    boolean_values = ['true', 'false', 'yes', 'no', '1', '0', 't', 'f', 'y', 'n']
-    if all(str(v).lower() in boolean_values for v in non_empty_values):
-        return "boolean", {"possible_values": list(set(str(v).lower() for v in non_empty_values))}
+    # Check for boolean values, stopping at the first non-boolean value
+    seen_booleans = set()
+    for v in non_empty_values:
+        value_lower = str(v).lower()
+        if value_lower not in _BOOLEAN_VALUES:
+            break
+        seen_booleans.add(value_lower)
+    else:
+        return "boolean", {"possible_values": list(seen_booleans)}
+    
+    # Threshold-based checks below run on a fixed-size sample of long columns
+    sampled_values = _sample_column_values(non_empty_values)
+    
+    # Columns that start with a number-like value are checked for numbers first.
+    # A value that parses as a number can never match a date pattern, so a
+    # numeric verdict here is the same one the date-first order would reach.
+    first_value = str(sampled_values[0]).lstrip()
+    numeric_checked = False
+    if first_value and (first_value[0].isdigit() or first_value[0] in '-+$.'):
+        numeric_type = _infer_numeric_type(sampled_values)
+        if numeric_type:
+            return numeric_type
+        numeric_checked = True
     
     # Check for dates
     date_patterns = [
@@ -3052,59 +3408,46 @@ def _infer_column_type(values: list, column_name: str) -> tuple[str, dict]:
     
     import re
     date_count = 0
-    for value in non_empty_values:
+    for value in sampled_values:
         value_str = str(value)
         for pattern in date_patterns:
             if re.match(pattern, value_str):
                 date_count += 1
                 break
     
-    if date_count >= len(non_empty_values) * 0.8:  # 80% match rate
+    if date_count >= len(sampled_values) * 0.8:  # 80% match rate
         return "date", {"format": "various"}
     
     # Check for numbers
-    numeric_count = 0
-    float_count = 0
-    for value in non_empty_values:
-        value_str = str(value).replace(',', '').replace('$', '').replace('%', '')
-        try:
-            float_val = float(value_str)
-            numeric_count += 1
-            if float_val != int(float_val):
-                float_count += 1
-        except ValueError:
-            pass
-    
-    if numeric_count >= len(non_empty_values) * 0.9:  # 90% numeric
-        if float_count > 0:
-            return "float", {"precision": "decimal"}
-        else:
-            return "integer", {"precision": "whole_number"}
+    if not numeric_checked:
+        numeric_type = _infer_numeric_type(sampled_values)
+        if numeric_type:
+            return numeric_type
     
     # Check for email addresses
     email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    email_count = sum(1 for v in non_empty_values if re.match(email_pattern, str(v)))
-    if email_count >= len(non_empty_values) * 0.8:
+    email_count = sum(1 for v in sampled_values if re.match(email_pattern, str(v)))
+    if email_count >= len(sampled_values) * 0.8:
         return "email", {"format": "standard"}
     
     # Check for URLs
     url_pattern = r'^https?://'
-    url_count = sum(1 for v in non_empty_values if re.match(url_pattern, str(v)))
-    if url_count >= len(non_empty_values) * 0.8:
+    url_count = sum(1 for v in sampled_values if re.match(url_pattern, str(v)))
+    if url_count >= len(sampled_values) * 0.8:
         return "url", {"protocol": "http/https"}
     
     # Check for phone numbers
     phone_pattern = r'^[\+]?[1-9][\d]{0,15}$'
-    phone_count = sum(1 for v in non_empty_values if re.match(phone_pattern, str(v).replace(' ', '').replace('-', '').replace('(', '').replace(')', '')))
-    if phone_count >= len(non_empty_values) * 0.8:
+    phone_count = sum(1 for v in sampled_values if re.match(phone_pattern, str(v).replace(' ', '').replace('-', '').replace('(', '').replace(')', '')))
+    if phone_count >= len(sampled_values) * 0.8:
         return "phone", {"format": "various"}
     
     # Default to string
-    max_length = max(len(str(v)) for v in non_empty_values)
+    max_length = max(map(len, map(str, non_empty_values)))
     constraints = {"max_length": max_length}
     
     # Check for categorical data (limited unique values)
-    unique_values = set(str(v) for v in non_empty_values)
+    unique_values = set(map(str, non_empty_values))
     if len(unique_values) <= min(10, len(non_empty_values) * 0.3):  # Less than 10 unique values or 30% of data
         constraints["categorical"] = True
         constraints["categories"] = list(unique_values)
@@ -3200,8 +3543,8 @@ async def insert_dimension(spreadsheet_id: str, insert_dimension: dict, include_
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # Prepare the request body
         request_body = {
@@ -3283,6 +3626,12 @@ async def insert_dimension(spreadsheet_id: str, insert_dimension: dict, include_
         }
 
 
+def _sheet_range(sheet_title: str, cells: str) -> str:
+    """Build an A1 range on a sheet, quoting the title and escaping any quotes in it"""
+    escaped_title = sheet_title.replace("'", "''")
+    return f"'{escaped_title}'!{cells}"
+
+
 @simple_mcp.tool()
 async def list_tables(spreadsheet_id: str, min_rows: int = 2, min_columns: int = 1, min_confidence: float = 0.5) -> dict:
     """List all tables in a Google spreadsheet by analyzing sheet structure and detecting data patterns.
@@ -3343,8 +3692,8 @@ async def list_tables(spreadsheet_id: str, min_rows: int = 2, min_columns: int =
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # First, get spreadsheet metadata to find sheets
         try:
@@ -3372,23 +3721,37 @@ async def list_tables(spreadsheet_id: str, min_rows: int = 2, min_columns: int =
         
         all_tables = []
         
+        # Only grid sheets hold cell values; chart sheets have no range to read
+        grid_sheets = [sheet for sheet in sheets if sheet.get('properties', {}).get('sheetType', 'GRID') == 'GRID']
+        ranges = [_sheet_range(sheet.get('properties', {}).get('title', 'Unknown'), "A:ZZ") for sheet in grid_sheets]  # Get all columns
+        
+        # Get data from all sheets in a single round trip
+        try:
+            batch_response = service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges
+            ).execute() if ranges else {}
+            sheet_values = [value_range.get('values', []) for value_range in batch_response.get('valueRanges', [])]
+        except Exception:
+            # One rejected range fails the whole batch, so fetch the sheets one by one instead
+            sheet_values = []
+            for sheet_range in ranges:
+                try:
+                    data_response = service.spreadsheets().values().get(
+                        spreadsheetId=spreadsheet_id,
+                        range=sheet_range
+                    ).execute()
+                    sheet_values.append(data_response.get('values', []))
+                except Exception:
+                    # Skip sheets that can't be accessed
+                    sheet_values.append([])
+        
         # Analyze each sheet for tables
-        for sheet in sheets:
+        for sheet, values in zip(grid_sheets, sheet_values):
             sheet_props = sheet.get('properties', {})
             sheet_title = sheet_props.get('title', 'Unknown')
             sheet_id = sheet_props.get('sheetId', 0)
             
-            # Get data from the sheet
-            try:
-                data_response = service.spreadsheets().values().get(
-                    spreadsheetId=spreadsheet_id,
-                    range=f"'{sheet_title}'!A:ZZ"  # Get all columns
-                ).execute()
-            except Exception as e:
-                # Skip sheets that can't be accessed
-                continue
-            
-            values = data_response.get('values', [])
             if not values:
                 continue
             
@@ -3407,6 +3770,17 @@ async def list_tables(spreadsheet_id: str, min_rows: int = 2, min_columns: int =
         # Sort tables by confidence score (highest first)
         all_tables.sort(key=lambda x: x['confidence'], reverse=True)
         
+        # Bucket tables by confidence in a single pass
+        high_confidence = medium_confidence = low_confidence = 0
+        for table in all_tables:
+            confidence = table['confidence']
+            if confidence >= 0.8:
+                high_confidence += 1
+            elif confidence >= 0.5:
+                medium_confidence += 1
+            else:
+                low_confidence += 1
+        
         return {
             "successful": True,
             "message": f"Found {len(all_tables)} table(s) across {len(sheets)} sheet(s)",
@@ -3419,9 +3793,9 @@ async def list_tables(spreadsheet_id: str, min_rows: int = 2, min_columns: int =
                 "min_confidence": min_confidence
             },
             "summary": {
-                "high_confidence_tables": len([t for t in all_tables if t['confidence'] >= 0.8]),
-                "medium_confidence_tables": len([t for t in all_tables if 0.5 <= t['confidence'] < 0.8]),
-                "low_confidence_tables": len([t for t in all_tables if t['confidence'] < 0.5])
+                "high_confidence_tables": high_confidence,
+                "medium_confidence_tables": medium_confidence,
+                "low_confidence_tables": low_confidence
             }
         }
         
@@ -3449,62 +3823,103 @@ def _detect_tables_in_sheet(values: list, sheet_title: str, sheet_id: int, min_r
         List of detected tables
     """
     tables = []
+    table_index = {"spans": {}, "names": {}}
     
     if len(values) < min_rows + 1:  # +1 for header
         return tables
     
+    # Classify every row once and share the result between strategies
+    row_features = _precompute_row_features(values)
+    
     # Strategy 1: Look for the main table (largest data region)
-    main_table = _find_main_table(values, sheet_title, sheet_id, min_rows, min_columns)
+    main_table = _find_main_table(values, row_features, sheet_title, sheet_id, min_rows, min_columns)
     if main_table and main_table['confidence'] >= min_confidence:
         tables.append(main_table)
+        _add_table_to_index(main_table, table_index)
     
     # Strategy 2: Look for multiple smaller tables separated by empty rows
-    smaller_tables = _find_smaller_tables(values, sheet_title, sheet_id, min_rows, min_columns)
+    smaller_tables = _find_smaller_tables(values, row_features, sheet_title, sheet_id, min_rows, min_columns)
     for table in smaller_tables:
-        if table['confidence'] >= min_confidence and not _is_table_duplicate(table, tables):
+        if table['confidence'] >= min_confidence and not _is_table_duplicate(table, table_index):
             tables.append(table)
+            _add_table_to_index(table, table_index)
     
     return tables
 
 
-def _is_table_duplicate(new_table: dict, existing_tables: list) -> bool:
-    """Check if a table is a duplicate of an existing table."""
-    for existing_table in existing_tables:
-        # Check if tables overlap significantly
-        if (new_table['start_row'] >= existing_table['start_row'] and 
-            new_table['end_row'] <= existing_table['end_row'] and
-            new_table['start_column'] == existing_table['start_column'] and
-            new_table['end_column'] == existing_table['end_column']):
-            return True
+def _precompute_row_features(values: list) -> dict:
+    """Normalize each row of a sheet and classify it as empty, header-like and data-like.
+    
+    Args:
+        values: 2D array of cell values
         
-        # Check if tables have the same name and similar structure
-        if (new_table['name'] == existing_table['name'] and
-            abs(new_table['row_count'] - existing_table['row_count']) <= 2):
+    Returns:
+        Dict with the stripped cell strings of every row under 'cells' and
+        per-row boolean lists keyed by 'empty', 'header' and 'data'
+    """
+    cell_rows = []
+    empty_flags = []
+    header_flags = []
+    data_flags = []
+    for row in values:
+        cells = [str(cell).strip() for cell in row]
+        cell_rows.append(cells)
+        is_empty = _is_empty_row(cells)
+        empty_flags.append(is_empty)
+        # Blank rows are never headers or data rows
+        header_flags.append(not is_empty and _is_likely_header_row(cells))
+        data_flags.append(not is_empty and _looks_like_data_row(cells))
+    
+    return {"cells": cell_rows, "empty": empty_flags, "header": header_flags, "data": data_flags}
+
+
+def _add_table_to_index(table: dict, table_index: dict) -> None:
+    """Record a table in the index used by _is_table_duplicate.
+    
+    Row spans are grouped by column span, and row counts are grouped by table name.
+    """
+    table_index["spans"].setdefault((table['start_column'], table['end_column']), []).append((table['start_row'], table['end_row']))
+    table_index["names"].setdefault(table['name'], []).append(table['row_count'])
+
+
+def _is_table_duplicate(new_table: dict, table_index: dict) -> bool:
+    """Check if a table is a duplicate of a table already in the index."""
+    # Check if the table lies within an existing table with the same columns
+    for start_row, end_row in table_index["spans"].get((new_table['start_column'], new_table['end_column']), []):
+        if start_row <= new_table['start_row'] and new_table['end_row'] <= end_row:
+            return True
+    
+    # Check if tables have the same name and similar structure
+    for row_count in table_index["names"].get(new_table['name'], []):
+        if abs(new_table['row_count'] - row_count) <= 2:
             return True
     
     return False
 
 
-def _find_main_table(values: list, sheet_title: str, sheet_id: int, min_rows: int, min_columns: int) -> dict | None:
+def _find_main_table(values: list, row_features: dict, sheet_title: str, sheet_id: int, min_rows: int, min_columns: int) -> dict | None:
     """Find the main/largest table in the sheet."""
     if len(values) < 2:
         return None
     
+    empty_flags = row_features['empty']
+    header_flags = row_features['header']
+    
     # Instead of finding one big table, look for the first well-formed table
     # This prevents detecting the entire sheet as one table
     for row_idx in range(len(values) - min_rows):
-        if _is_likely_header_row(values[row_idx]):
+        if header_flags[row_idx]:
             # Check if there's enough data below this header
             data_rows = 0
             table_end = row_idx + 1
             
             # Look for the end of this table (empty row or different structure)
             for check_row in range(row_idx + 1, len(values)):
-                if _is_empty_row(values[check_row]):
+                if empty_flags[check_row]:
                     # Found empty row, table ends here
                     table_end = check_row
                     break
-                elif _is_likely_header_row(values[check_row]):
+                elif header_flags[check_row]:
                     # Found another header, table ends before this
                     table_end = check_row
                     break
@@ -3515,9 +3930,9 @@ def _find_main_table(values: list, sheet_title: str, sheet_id: int, min_rows: in
                 table_data = values[row_idx:table_end]
                 # Find the actual column boundary for this table
                 max_cols = 0
-                for row in table_data:
-                    for col_idx, cell in enumerate(row):
-                        if cell and str(cell).strip():
+                for cells in row_features['cells'][row_idx:table_end]:
+                    for col_idx, cell in enumerate(cells):
+                        if cell:
                             max_cols = max(max_cols, col_idx + 1)
                 
                 if max_cols >= min_columns:
@@ -3540,8 +3955,8 @@ def _find_main_table(values: list, sheet_title: str, sheet_id: int, min_rows: in
                         "start_row": row_idx + 1,
                         "end_row": table_end,
                         "start_column": "A",
-                        "end_column": chr(64 + max_cols),
-                        "range": f"'{sheet_title}'!A{row_idx + 1}:{chr(64 + max_cols)}{table_end}",
+                        "end_column": _COLUMN_LETTERS[max_cols - 1],
+                        "range": f"'{sheet_title}'!A{row_idx + 1}:{_COLUMN_LETTERS[max_cols - 1]}{table_end}",
                         "row_count": data_rows,
                         "column_count": max_cols,
                         "confidence": confidence,
@@ -3553,7 +3968,7 @@ def _find_main_table(values: list, sheet_title: str, sheet_id: int, min_rows: in
     return None
 
 
-def _find_smaller_tables(values: list, sheet_title: str, sheet_id: int, min_rows: int, min_columns: int) -> list:
+def _find_smaller_tables(values: list, row_features: dict, sheet_title: str, sheet_id: int, min_rows: int, min_columns: int) -> list:
     """Find smaller tables within the sheet."""
     tables = []
     
@@ -3561,7 +3976,7 @@ def _find_smaller_tables(values: list, sheet_title: str, sheet_id: int, min_rows
     current_start = None
     for row_idx in range(len(values)):
         # Check if this row is empty or mostly empty
-        is_empty = _is_empty_row(values[row_idx])
+        is_empty = row_features['empty'][row_idx]
         
         if not is_empty and current_start is None:
             # Found start of a potential table
@@ -3571,8 +3986,8 @@ def _find_smaller_tables(values: list, sheet_title: str, sheet_id: int, min_rows
             table_data = values[current_start:row_idx]
             if len(table_data) >= min_rows + 1 and any(len(row) >= min_columns for row in table_data):
                 # Additional check: ensure this looks like a real table, not just data rows
-                if _is_likely_real_table(table_data):
-                    table = _create_table_from_data(table_data, sheet_title, sheet_id, current_start + 1, "empty_row_separation")
+                if _is_likely_real_table(row_features, current_start, row_idx):
+                    table = _create_table_from_data(table_data, row_features['cells'][current_start:row_idx], sheet_title, sheet_id, current_start + 1, "empty_row_separation")
                     if table:
                         tables.append(table)
             current_start = None
@@ -3581,58 +3996,46 @@ def _find_smaller_tables(values: list, sheet_title: str, sheet_id: int, min_rows
     if current_start is not None:
         table_data = values[current_start:]
         if len(table_data) >= min_rows + 1 and any(len(row) >= min_columns for row in table_data):
-            if _is_likely_real_table(table_data):
-                table = _create_table_from_data(table_data, sheet_title, sheet_id, current_start + 1, "end_of_sheet")
+            if _is_likely_real_table(row_features, current_start, len(values)):
+                table = _create_table_from_data(table_data, row_features['cells'][current_start:], sheet_title, sheet_id, current_start + 1, "end_of_sheet")
                 if table:
                     tables.append(table)
     
     return tables
 
 
-def _is_empty_row(row: list) -> bool:
-    """Check if a row is empty or mostly empty."""
-    if not row:
-        return True
-    
-    # Check if all cells are empty or just whitespace
-    for cell in row:
-        if cell and str(cell).strip():
-            return False
-    
-    return True
+def _is_empty_row(cells: list) -> bool:
+    """Check if a row of stripped cell strings is empty."""
+    # Check if all cells are empty (whitespace was stripped during normalization)
+    return not any(cells)
 
 
-def _is_likely_real_table(table_data: list) -> bool:
-    """Check if the data looks like a real table rather than just data rows."""
-    if not table_data or len(table_data) < 2:
+def _is_likely_real_table(row_features: dict, start: int, end: int) -> bool:
+    """Check if rows start..end-1 look like a real table rather than just data rows."""
+    if end - start < 2:
         return False
     
     # Check if the first row looks like a header
-    first_row = table_data[0]
-    if not _is_likely_header_row(first_row):
+    if not row_features['header'][start]:
         return False
     
     # Check if subsequent rows look like data (not headers)
-    data_row_count = 0
-    for row in table_data[1:]:
-        if _looks_like_data_row(row):
-            data_row_count += 1
+    data_row_count = sum(row_features['data'][start + 1:end])
     
     # At least 60% of non-header rows should look like data
-    return data_row_count >= len(table_data[1:]) * 0.6
+    return data_row_count >= (end - start - 1) * 0.6
 
 
-def _looks_like_data_row(row: list) -> bool:
-    """Check if a row looks like data rather than a header."""
-    if not row:
+def _looks_like_data_row(cells: list) -> bool:
+    """Check if a row of stripped cell strings looks like data rather than a header."""
+    if not cells:
         return False
     
     # Data rows typically have mixed case, contain numbers, or are longer
     data_indicators = 0
-    total_cells = len(row)
+    total_cells = len(cells)
     
-    for cell in row:
-        cell_str = str(cell).strip()
+    for cell_str in cells:
         if not cell_str:
             continue
         
@@ -3649,48 +4052,19 @@ def _looks_like_data_row(row: list) -> bool:
     return data_indicators >= total_cells * 0.4  # 40% of cells show data characteristics
 
 
-def _find_bounded_tables(values: list, sheet_title: str, sheet_id: int, min_rows: int, min_columns: int) -> list:
-    """Find tables with clear boundaries (headers, formatting, etc.)."""
-    tables = []
-    
-    # Look for tables with clear header patterns
-    for row_idx in range(len(values) - min_rows):
-        if _is_likely_header_row(values[row_idx]):
-            # Check if there's data below
-            data_rows = 0
-            for check_row in range(row_idx + 1, min(row_idx + min_rows + 5, len(values))):
-                if any(cell.strip() for cell in values[check_row] if cell):
-                    data_rows += 1
-            
-            if data_rows >= min_rows:
-                table_data = values[row_idx:row_idx + data_rows + 1]
-                table = _create_table_from_data(table_data, sheet_title, sheet_id, row_idx + 1, "header_pattern")
-                if table:
-                    tables.append(table)
-    
-    return tables
-
-
-def _create_table_from_data(table_data: list, sheet_title: str, sheet_id: int, start_row: int, detection_method: str) -> dict | None:
-    """Create a table object from table data."""
+def _create_table_from_data(table_data: list, cell_rows: list, sheet_title: str, sheet_id: int, start_row: int, detection_method: str) -> dict | None:
+    """Create a table object from table data and its stripped cell strings."""
     if not table_data or len(table_data) < 2:
         return None
     
-    # Find the actual data boundary
-    max_cols = max(len(row) for row in table_data)
-    if max_cols == 0:
-        return None
-    
-    # Trim empty columns
-    while max_cols > 0:
-        has_data = False
-        for row in table_data:
-            if len(row) > max_cols - 1 and row[max_cols - 1].strip():
-                has_data = True
+    # Find the actual data boundary, scanning each row from the right only
+    # until it reaches the widest column already known to hold data
+    max_cols = 0
+    for cells in cell_rows:
+        for col_idx in range(len(cells) - 1, max_cols - 1, -1):
+            if cells[col_idx]:
+                max_cols = col_idx + 1
                 break
-        if has_data:
-            break
-        max_cols -= 1
     
     if max_cols == 0:
         return None
@@ -3712,8 +4086,8 @@ def _create_table_from_data(table_data: list, sheet_title: str, sheet_id: int, s
         "start_row": start_row,
         "end_row": start_row + len(data_rows),
         "start_column": "A",
-        "end_column": chr(64 + max_cols),
-        "range": f"'{sheet_title}'!A{start_row}:{chr(64 + max_cols)}{start_row + len(data_rows)}",
+        "end_column": _COLUMN_LETTERS[max_cols - 1],
+        "range": f"'{sheet_title}'!A{start_row}:{_COLUMN_LETTERS[max_cols - 1]}{start_row + len(data_rows)}",
         "row_count": len(data_rows),
         "column_count": max_cols,
         "confidence": confidence,
@@ -3723,18 +4097,17 @@ def _create_table_from_data(table_data: list, sheet_title: str, sheet_id: int, s
     }
 
 
-def _is_likely_header_row(row: list) -> bool:
-    """Check if a row is likely to be a header row."""
-    if not row:
+def _is_likely_header_row(cells: list) -> bool:
+    """Check if a row of stripped cell strings is likely to be a header row."""
+    if not cells:
         return False
     
     # Check for common header patterns
     header_indicators = 0
-    total_cells = len(row)
+    total_cells = len(cells)
     non_empty_cells = 0
     
-    for cell in row:
-        cell_str = str(cell).strip()
+    for cell_str in cells:
         if not cell_str:
             continue
         
@@ -3779,8 +4152,11 @@ def _calculate_table_confidence(table_data: list) -> float:
     confidence += header_quality * 0.3
     
     # Factor 3: Data density (0.2 points)
-    total_cells = sum(len(row) for row in table_data)
-    non_empty_cells = sum(1 for row in table_data for cell in row if str(cell).strip())
+    total_cells = 0
+    non_empty_cells = 0
+    for row in table_data:
+        total_cells += len(row)
+        non_empty_cells += sum(map(bool, map(str.strip, map(str, row))))
     if total_cells > 0:
         data_density = non_empty_cells / total_cells
         confidence += data_density * 0.2
@@ -3858,47 +4234,44 @@ async def lookup_spreadsheet_row(spreadsheet_id: str, query: str, range: str | N
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # Determine the range to search
         search_range = range
         if not search_range:
-            # Get spreadsheet metadata to determine the first sheet
-            try:
-                metadata_response = service.spreadsheets().get(
-                    spreadsheetId=spreadsheet_id,
-                    ranges=[],
-                    includeGridData=False
-                ).execute()
-                
-                sheets = metadata_response.get('sheets', [])
-                if not sheets:
-                    return {
-                        "successful": False,
-                        "message": "No sheets found in the spreadsheet",
-                        "found_row": None,
-                        "error": "No sheets available"
-                    }
-                
-                # Use the first sheet
-                first_sheet = sheets[0]
-                sheet_title = first_sheet.get('properties', {}).get('title', 'Sheet1')
-                search_range = f"'{sheet_title}'!A:ZZ"  # Search all columns
-                
-            except Exception as e:
+            # Use the first sheet, whose title usually comes from the metadata cache
+            (metadata_response,) = await _get_spreadsheet_metas(service, spreadsheet_id)
+            if isinstance(metadata_response, Exception):
                 return {
                     "successful": False,
-                    "message": f"Could not access spreadsheet metadata. Details: {str(e)}",
+                    "message": f"Could not access spreadsheet metadata. Details: {str(metadata_response)}",
                     "found_row": None,
-                    "error": str(e)
+                    "error": str(metadata_response)
                 }
+            
+            sheets = metadata_response.get('sheets', [])
+            if not sheets:
+                return {
+                    "successful": False,
+                    "message": "No sheets found in the spreadsheet",
+                    "found_row": None,
+                    "error": "No sheets available"
+                }
+            
+            sheet_name = sheets[0].get('properties', {}).get('title', 'Sheet1')
+            search_range = _sheet_range(sheet_name, "A:ZZ")  # Search all columns
+        else:
+            # Parse the range to get sheet name and cell range
+            sheet_name, cell_range = _parse_range(search_range)
         
-        # Get the data from the specified range
+        # Get the data from the specified range, limiting the response to the fields used
         try:
             data_response = service.spreadsheets().values().get(
                 spreadsheetId=spreadsheet_id,
-                range=search_range
+                range=search_range,
+                majorDimension='ROWS',
+                fields='range,values'
             ).execute()
         except Exception as e:
             return {
@@ -3917,39 +4290,31 @@ async def lookup_spreadsheet_row(spreadsheet_id: str, query: str, range: str | N
                 "error": "No data available"
             }
         
-        # Parse the range to get sheet name and cell range
-        sheet_name, cell_range = _parse_range(search_range)
-        
         # Search for the query string
         found_row_info = None
-        search_query = query if case_sensitive else query.lower()
-        
-        for row_idx, row in enumerate(values):
-            for col_idx, cell_value in enumerate(row):
-                cell_str = str(cell_value)
-                compare_value = cell_str if case_sensitive else cell_str.lower()
-                
-                if compare_value == search_query:
-                    # Convert 0-based index to 1-based row number
-                    row_number = row_idx + 1
-                    column_letter = chr(65 + col_idx)  # A, B, C, etc.
-                    cell_address = f"{column_letter}{row_number}"
-                    
-                    found_row_info = {
-                        "row_number": row_number,
-                        "column_index": col_idx,
-                        "column_letter": column_letter,
-                        "cell_address": cell_address,
-                        "cell_value": cell_str,
-                        "sheet_name": sheet_name,
-                        "range": search_range,
-                        "query": query,
-                        "case_sensitive": case_sensitive
-                    }
-                    break
+        search_query = query if case_sensitive else query.casefold()
+        match = _scan_for_cell(values, search_query, case_sensitive)
+        total_rows_searched = len(values)
+        total_cells_searched = sum(map(len, values))
+        
+        if match:
+            row_idx, col_idx, cell_str = match
+            # Convert 0-based index to 1-based row number
+            row_number = row_idx + 1
+            column_letter = _column_letter(col_idx)  # A, B, ..., Z, AA, etc.
+            cell_address = f"{column_letter}{row_number}"
             
-            if found_row_info:
-                break
+            found_row_info = {
+                "row_number": row_number,
+                "column_index": col_idx,
+                "column_letter": column_letter,
+                "cell_address": cell_address,
+                "cell_value": cell_str,
+                "sheet_name": sheet_name,
+                "range": search_range,
+                "query": query,
+                "case_sensitive": case_sensitive
+            }
         
         if found_row_info:
             return {
@@ -3957,8 +4322,8 @@ async def lookup_spreadsheet_row(spreadsheet_id: str, query: str, range: str | N
                 "message": f"Found query '{query}' in cell {found_row_info['cell_address']} on row {found_row_info['row_number']}",
                 "found_row": found_row_info,
                 "search_range": search_range,
-                "total_rows_searched": len(values),
-                "total_cells_searched": sum(len(row) for row in values)
+                "total_rows_searched": total_rows_searched,
+                "total_cells_searched": total_cells_searched
             }
         else:
             return {
@@ -3966,8 +4331,8 @@ async def lookup_spreadsheet_row(spreadsheet_id: str, query: str, range: str | N
                 "message": f"Query '{query}' not found in range '{search_range}'",
                 "found_row": None,
                 "search_range": search_range,
-                "total_rows_searched": len(values),
-                "total_cells_searched": sum(len(row) for row in values),
+                "total_rows_searched": total_rows_searched,
+                "total_cells_searched": total_cells_searched,
                 "error": "Query not found"
             }
         
@@ -3980,6 +4345,32 @@ async def lookup_spreadsheet_row(spreadsheet_id: str, query: str, range: str | N
         }
 
 
+def _scan_for_cell(values: list, search_query: str, case_sensitive: bool) -> tuple[int, int, str] | None:
+    """Scan the values row by row and return the first cell matching the normalized query."""
+    query_length = len(search_query)
+    # str() returns string cells unchanged, so map(str, row) only converts numbers
+    if case_sensitive:
+        matches = (
+            (row_idx, col_idx, cell_str)
+            for row_idx, row in enumerate(values)
+            for col_idx, cell_str in enumerate(map(str, row))
+            if cell_str == search_query
+        )
+    else:
+        # Casefolding maps each character to one or more characters, so a cell longer
+        # than the query cannot match, and its folded first character must start the query
+        matches = (
+            (row_idx, col_idx, cell_str)
+            for row_idx, row in enumerate(values)
+            for col_idx, cell_str in enumerate(map(str, row))
+            if len(cell_str) <= query_length
+            and search_query.startswith(cell_str[:1].casefold())
+            and cell_str.casefold() == search_query
+        )
+    
+    return next(matches, None)
+
+
 def _parse_range(range_str: str) -> tuple[str, str]:
     """Parse A1 notation range to extract sheet name and cell range.
     
@@ -3989,15 +4380,18 @@ def _parse_range(range_str: str) -> tuple[str, str]:
     Returns:
         Tuple of (sheet_name, cell_range)
     """
-    if '!' in range_str:
-        sheet_name, cell_range = range_str.split('!', 1)
+    sheet_name, sep, cell_range = range_str.partition('!')
+    if sep:
         # Remove quotes from sheet name if present
-        sheet_name = sheet_name.strip().strip("'\"")
-        return sheet_name, cell_range
+        return sheet_name.strip().strip("'\""), cell_range
     else:
         return "Sheet1", range_str
 
 
+# Sheet prefix applied to A1 filters that don't name a sheet
+_DEFAULT_SHEET_PREFIX = "Sheet1!"
+
+
 @simple_mcp.tool()
 async def search_developer_metadata(spreadsheet_id: str, data_filters: list) -> dict:
     """Search for developer metadata in a spreadsheet.
@@ -4040,8 +4434,8 @@ async def search_developer_metadata(spreadsheet_id: str, data_filters: list) ->
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # Process data filters to ensure proper format
         processed_filters = []
@@ -4055,7 +4449,7 @@ async def search_developer_metadata(spreadsheet_id: str, data_filters: list) ->
                 else:
                     # No sheet name specified, use first sheet
                     processed_filters.append({
-                        'a1Range': f"Sheet1!{filter_item}"
+                        'a1Range': _DEFAULT_SHEET_PREFIX + filter_item
                     })
             elif isinstance(filter_item, dict):
                 # Already a proper DataFilter object
@@ -4075,11 +4469,12 @@ async def search_developer_metadata(spreadsheet_id: str, data_filters: list) ->
             'excludeTablesInBandedRanges': False
         }
         
-        # Execute the search using getByDataFilter
+        # Execute the search using getByDataFilter, requesting only the fields read below
         try:
             response = service.spreadsheets().getByDataFilter(
                 spreadsheetId=spreadsheet_id,
-                body=request_body
+                body=request_body,
+                fields='properties.title,developerMetadata,sheets(properties(sheetId,title),developerMetadata)'
             ).execute()
         except Exception as e:
             return {
@@ -4152,17 +4547,22 @@ async def search_developer_metadata(spreadsheet_id: str, data_filters: list) ->
                 
                 metadata_results.append(metadata_info)
         
-        # Get spreadsheet info for context
-        try:
-            spreadsheet_info = service.spreadsheets().get(
-                spreadsheetId=spreadsheet_id,
-                ranges=[],
-                includeGridData=False
-            ).execute()
-            
-            spreadsheet_title = spreadsheet_info.get('properties', {}).get('title', 'Unknown')
-        except Exception:
-            spreadsheet_title = "Unknown"
+        # The getByDataFilter response is a Spreadsheet, so it already carries the title
+        spreadsheet_title = response.get('properties', {}).get('title', 'Unknown')
+        
+        # Summarize the results in a single pass
+        sheet_level_count = 0
+        document_level_count = 0
+        unique_keys = set()
+        unique_sheets = set()
+        for m in metadata_results:
+            if m['sheet_name'] == 'Document Level':
+                document_level_count += 1
+            else:
+                sheet_level_count += 1
+            if m['metadata_key']:
+                unique_keys.add(m['metadata_key'])
+            unique_sheets.add(m['sheet_name'])
         
         return {
             "successful": True,
@@ -4173,10 +4573,10 @@ async def search_developer_metadata(spreadsheet_id: str, data_filters: list) ->
             "total_metadata_entries": len(metadata_results),
             "search_filters": processed_filters,
             "summary": {
-                "sheet_level_metadata": len([m for m in metadata_results if m['sheet_name'] != 'Document Level']),
-                "document_level_metadata": len([m for m in metadata_results if m['sheet_name'] == 'Document Level']),
-                "unique_keys": len(set(m['metadata_key'] for m in metadata_results if m['metadata_key'])),
-                "unique_sheets": len(set(m['sheet_name'] for m in metadata_results))
+                "sheet_level_metadata": sheet_level_count,
+                "document_level_metadata": document_level_count,
+                "unique_keys": len(unique_keys),
+                "unique_sheets": len(unique_sheets)
             }
         }
         
@@ -4189,8 +4589,48 @@ async def search_developer_metadata(spreadsheet_id: str, data_filters: list) ->
         }
 
 
+# Any Drive query operator (case-insensitive); queries without one are treated as a plain name search
+_QUERY_OPERATOR_RE = re.compile(
+    r"name contains|fulltext contains|name =|createdtime|modifiedtime|sharedwithme|starred|trashed|owners|in parents",
+    re.IGNORECASE | re.ASCII,
+)
+
+# Whitespace-separated query tokens kept in the Drive query: two-word operators,
+# single-word operators, logical operators/punctuation and quoted strings
+_QUERY_PART_RE = re.compile(
+    r"""(?<!\S)(?:"""
+    r"""(?:name\s+contains|name\s+=|fullText\s+contains|createdTime\s+[><]|modifiedTime\s+[><]|in\s+parents)"""
+    r"""|(?:sharedWithMe|starred|trashed|and|or|not|[()=><'"])"""
+    r"""|['"]\S*|\S*['"]"""
+    r""")(?!\S)"""
+)
+
+# Dangling logical operators at either end of a space-joined query
+_TRAILING_LOGICAL_RE = re.compile(r"(?:(?:^| )(?:and|or|not))+$")
+_LEADING_LOGICAL_RE = re.compile(r"^(?:(?:and|or|not)(?: |$))+")
+
+
+# Scalar Drive file fields copied into search results as (result key, API key, default)
+_FILE_FIELDS = (
+    ("id", "id", ""),
+    ("name", "name", ""),
+    ("mime_type", "mimeType", ""),
+    ("created_time", "createdTime", ""),
+    ("modified_time", "modifiedTime", ""),
+    ("size", "size", "0"),
+    ("shared", "shared", False),
+    ("starred", "starred", False),
+    ("trashed", "trashed", False),
+    ("web_view_link", "webViewLink", ""),
+    ("web_content_link", "webContentLink", ""),
+)
+_FILE_FIELD_NAMES = tuple(name for name, _, _ in _FILE_FIELDS)
+_FILE_FIELD_DEFAULTS = {api_key: default for _, api_key, default in _FILE_FIELDS}
+_get_file_fields = operator.itemgetter(*(api_key for _, api_key, _ in _FILE_FIELDS))
+
+
 @simple_mcp.tool()
-async def search_spreadsheets(query: str | None = None, max_results: int = 10, order_by: str = "modifiedTime desc", shared_with_me: bool = False, starred_only: bool = False, include_trashed: bool = False, created_after: str | None = None, modified_after: str | None = None) -> dict:
+async def search_spreadsheets(query: str | None = None, max_results: int = 10, order_by: str = "modifiedTime desc", shared_with_me: bool = False, starred_only: bool = False, include_trashed: bool = False, created_after: str | None = None, modified_after: str | None = None, page_token: str | None = None) -> dict:
     """Search for Google spreadsheets using various filters including name, content, date ranges, and more.
     
     Search for google spreadsheets using various filters including name, content, date ranges, and more.
@@ -4207,6 +4647,7 @@ async def search_spreadsheets(query: str | None = None, max_results: int = 10, o
         include_trashed: Whether to include spreadsheets in trash. Defaults to False.
         created_after: Return spreadsheets created after this date. Use RFC 3339 format like '2024-01-01T00:00:00Z'.
         modified_after: Return spreadsheets modified after this date. Use RFC 3339 format like '2024-01-01T00:00:00Z'.
+        page_token: Token for the next page of results. Use this for pagination.
     """
     # Check credentials first
     creds_valid, error_msg = check_credentials()
@@ -4230,8 +4671,8 @@ async def search_spreadsheets(query: str | None = None, max_results: int = 10, o
         }
     
     try:
-        # Build the Drive service
-        service = build('drive', 'v3', credentials=creds)
+        # Get the Drive service
+        service = get_service('drive', 'v3')
         
         # Build the query string
         query_parts = []
@@ -4245,73 +4686,34 @@ async def search_spreadsheets(query: str | None = None, max_results: int = 10, o
             processed_query = query
             
             # Handle simple string queries (convert to name contains)
-            if not any(op in processed_query.lower() for op in ["name contains", "fulltext contains", "name =", "createdtime", "modifiedtime", "sharedwithme", "starred", "trashed", "owners", "in parents"]):
+            if not _QUERY_OPERATOR_RE.search(processed_query):
                 # If it's just a simple string, convert it to a name contains query
                 processed_query = f"name contains '{processed_query}'"
             
             # Handle common search patterns - Google Drive API is case-sensitive
-            if "name contains" in processed_query.lower():
-                # Convert "name contains 'value'" to "name contains 'value'" (lowercase)
-                processed_query = processed_query.lower().replace("name contains", "name contains")
-            elif "fulltext contains" in processed_query.lower():
+            query_lower = processed_query.lower()
+            if "name contains" in query_lower:
+                # "name contains" queries are lowercased
+                processed_query = query_lower
+            elif "fulltext contains" in query_lower:
                 # Convert "fulltext contains 'value'" to "fullText contains 'value'" (correct case)
                 processed_query = processed_query.replace("fulltext contains", "fullText contains")
             elif "name =" in processed_query:
-                # Convert "name = 'value'" to "name = 'value'" (lowercase)
-                processed_query = processed_query.lower().replace("name =", "name =")
+                # "name =" queries are lowercased
+                processed_query = query_lower
             
-            # Extract only valid Google Drive API query parts
-            # Remove natural language parts that aren't supported
-            valid_operators = [
-                "name contains", "name =", "fullText contains", 
-                "createdTime >", "createdTime <", "modifiedTime >", "modifiedTime <",
-                "sharedWithMe", "starred", "trashed", "owners", "in parents"
-            ]
-            
-            # Split the query and keep only valid parts
-            query_words = processed_query.split()
-            valid_parts = []
-            i = 0
-            while i < len(query_words):
-                # Check for multi-word operators
-                if i + 1 < len(query_words):
-                    two_word_op = f"{query_words[i]} {query_words[i+1]}"
-                    if two_word_op in valid_operators:
-                        valid_parts.extend([query_words[i], query_words[i+1]])
-                        i += 2
-                        continue
-                
-                # Check for single-word operators
-                if query_words[i] in ["sharedWithMe", "starred", "trashed"]:
-                    valid_parts.append(query_words[i])
-                elif query_words[i] in ["and", "or", "not", "(", ")", "=", ">", "<", "'", '"']:
-                    # Keep logical operators and quotes
-                    valid_parts.append(query_words[i])
-                elif query_words[i].startswith("'") or query_words[i].endswith("'"):
-                    # Keep quoted strings
-                    valid_parts.append(query_words[i])
-                elif query_words[i].startswith('"') or query_words[i].endswith('"'):
-                    # Keep quoted strings
-                    valid_parts.append(query_words[i])
-                else:
-                    # Skip unrecognized terms
-                    pass
-                i += 1
+            # Extract only valid Google Drive API query parts, dropping natural
+            # language words that aren't supported
+            valid_parts = [match.group(0) for match in _QUERY_PART_RE.finditer(processed_query)]
             
             # Reconstruct the valid query
             if valid_parts:
-                processed_query = " ".join(valid_parts)
-                
-                # Clean up incomplete logical expressions
-                processed_query = processed_query.strip()
+                # Join with single spaces, also inside two-word operators
+                processed_query = " ".join(" ".join(valid_parts).split())
                 
-                # Remove trailing logical operators
-                while processed_query.endswith((' and', ' or', ' not')):
-                    processed_query = processed_query[:-4] if processed_query.endswith(' and') else processed_query[:-3]
-                
-                # Remove leading logical operators
-                while processed_query.startswith(('and ', 'or ', 'not ')):
-                    processed_query = processed_query[4:] if processed_query.startswith('and ') else processed_query[3:]
+                # Remove trailing and leading logical operators
+                processed_query = _TRAILING_LOGICAL_RE.sub('', processed_query)
+                processed_query = _LEADING_LOGICAL_RE.sub('', processed_query)
                 
                 # Remove empty parentheses
                 processed_query = processed_query.replace('()', '').replace('( )', '')
@@ -4356,8 +4758,8 @@ async def search_spreadsheets(query: str | None = None, max_results: int = 10, o
         }
         
         # Add page token if provided (for pagination)
-        if hasattr(search_spreadsheets, 'page_token') and search_spreadsheets.page_token:
-            request_params['pageToken'] = search_spreadsheets.page_token
+        if page_token:
+            request_params['pageToken'] = page_token
         
         request = service.files().list(**request_params)
         
@@ -4381,7 +4783,8 @@ async def search_spreadsheets(query: str | None = None, max_results: int = 10, o
                 "error": f"Invalid response format: {type(response)}"
             }
         
-        files = response.get('files', [])
+        # Drop malformed entries once instead of checking each file in the loop below
+        files = [file for file in response.get('files', []) if isinstance(file, dict)]
         next_page_token = response.get('nextPageToken')
         
         # Debug: Log the response structure
@@ -4405,7 +4808,8 @@ async def search_spreadsheets(query: str | None = None, max_results: int = 10, o
                     "starred_only": starred_only,
                     "include_trashed": include_trashed,
                     "created_after": created_after,
-                    "modified_after": modified_after
+                    "modified_after": modified_after,
+                    "page_token": page_token
                 },
                 "summary": {
                     "total_spreadsheets": 0,
@@ -4416,61 +4820,41 @@ async def search_spreadsheets(query: str | None = None, max_results: int = 10, o
                 }
             }
         
-        # Process the results
+        # Process the results, counting the summary totals in the same pass
         spreadsheets = []
+        shared_count = starred_count = trashed_count = owned_count = 0
         try:
             for file in files:
-                if not isinstance(file, dict):
-                    continue
-                    
-                spreadsheet_info = {
-                    "id": file.get('id', ''),
-                    "name": file.get('name', ''),
-                    "mime_type": file.get('mimeType', ''),
-                    "created_time": file.get('createdTime', ''),
-                    "modified_time": file.get('modifiedTime', ''),
-                    "size": file.get('size', '0'),
-                    "shared": file.get('shared', False),
-                    "starred": file.get('starred', False),
-                    "trashed": file.get('trashed', False),
-                    "web_view_link": file.get('webViewLink', ''),
-                    "web_content_link": file.get('webContentLink', ''),
-                    "owners": [owner.get('displayName', '') for owner in file.get('owners', []) if isinstance(owner, dict)],
-                    "parent_folders": [parent.get('id', '') for parent in file.get('parents', []) if isinstance(parent, dict)]
-                }
+                # Copy the scalar fields (with defaults for missing ones) in one C-level pass
+                spreadsheet_info = dict(zip(_FILE_FIELD_NAMES, _get_file_fields(_FILE_FIELD_DEFAULTS | file)))
+                spreadsheet_info["owners"] = [owner.get('displayName', '') for owner in file.get('owners') or () if isinstance(owner, dict)]
+                spreadsheet_info["parent_folders"] = list(file.get('parents') or ())  # Drive v3 returns parent IDs as strings
                 
                 # Add human-readable dates
                 if spreadsheet_info['created_time']:
-                    try:
-                        from datetime import datetime
-                        created_dt = datetime.fromisoformat(spreadsheet_info['created_time'].replace('Z', '+00:00'))
-                        spreadsheet_info['created_date'] = created_dt.strftime('%Y-%m-%d %H:%M:%S')
-                    except:
-                        spreadsheet_info['created_date'] = spreadsheet_info['created_time']
+                    spreadsheet_info['created_date'] = _format_timestamp(spreadsheet_info['created_time'])
                 
                 if spreadsheet_info['modified_time']:
-                    try:
-                        from datetime import datetime
-                        modified_dt = datetime.fromisoformat(spreadsheet_info['modified_time'].replace('Z', '+00:00'))
-                        spreadsheet_info['modified_date'] = modified_dt.strftime('%Y-%m-%d %H:%M:%S')
-                    except:
-                        spreadsheet_info['modified_date'] = spreadsheet_info['modified_time']
+                    spreadsheet_info['modified_date'] = _format_timestamp(spreadsheet_info['modified_time'])
                 
                 # Add size in human-readable format
                 if spreadsheet_info['size'] != '0':
                     try:
-                        size_bytes = int(spreadsheet_info['size'])
-                        if size_bytes < 1024:
-                            spreadsheet_info['size_formatted'] = f"{size_bytes} B"
-                        elif size_bytes < 1024 * 1024:
-                            spreadsheet_info['size_formatted'] = f"{size_bytes / 1024:.1f} KB"
-                        else:
-                            spreadsheet_info['size_formatted'] = f"{size_bytes / (1024 * 1024):.1f} MB"
+                        spreadsheet_info['size_formatted'] = _format_size(int(spreadsheet_info['size']))
                     except:
                         spreadsheet_info['size_formatted'] = spreadsheet_info['size']
                 else:
                     spreadsheet_info['size_formatted'] = "0 B"
                 
+                if spreadsheet_info['shared']:
+                    shared_count += 1
+                if spreadsheet_info['starred']:
+                    starred_count += 1
+                if spreadsheet_info['trashed']:
+                    trashed_count += 1
+                if spreadsheet_info['owners']:
+                    owned_count += 1
+                
                 spreadsheets.append(spreadsheet_info)
         
         except Exception as e:
@@ -4503,14 +4887,15 @@ async def search_spreadsheets(query: str | None = None, max_results: int = 10, o
                 "starred_only": starred_only,
                 "include_trashed": include_trashed,
                 "created_after": created_after,
-                "modified_after": modified_after
+                "modified_after": modified_after,
+                "page_token": page_token
             },
             "summary": {
                 "total_spreadsheets": len(spreadsheets),
-                "shared_spreadsheets": len([s for s in spreadsheets if s['shared']]),
-                "starred_spreadsheets": len([s for s in spreadsheets if s['starred']]),
-                "trashed_spreadsheets": len([s for s in spreadsheets if s['trashed']]),
-                "owned_by_me": len([s for s in spreadsheets if s['owners'] and len(s['owners']) > 0])
+                "shared_spreadsheets": shared_count,
+                "starred_spreadsheets": starred_count,
+                "trashed_spreadsheets": trashed_count,
+                "owned_by_me": owned_count
             }
         }
         
@@ -4523,11 +4908,50 @@ async def search_spreadsheets(query: str | None = None, max_results: int = 10, o
         }
 
 
+# Requests queued by set_basic_filter and clear_basic_filter while a batch is open, keyed by
+# spreadsheet ID, with the time the batch was last used and the credentials that opened it.
+# begin_batch opens a batch, commit_batch sends the queue as one batchUpdate and discard_batch
+# drops it. A batch left idle for _BATCH_TTL seconds (e.g. by a client that went away) or opened
+# under other credentials is discarded, so later changes are sent right away again.
+_PENDING_BATCHES: dict[str, tuple[float, Credentials, list]] = {}
+_BATCH_TTL = 300.0
+
+def _open_batch(spreadsheet_id: str) -> list | None:
+    """Return the queue of the spreadsheet's open batch.
+    
+    Returns None if there is none, or drops it and returns None if it expired or was opened
+    under other credentials.
+    """
+    entry = _PENDING_BATCHES.get(spreadsheet_id)
+    if entry is None:
+        return None
+    last_used, batch_creds, pending = entry
+    if time.monotonic() - last_used > _BATCH_TTL or batch_creds is not creds:
+        del _PENDING_BATCHES[spreadsheet_id]
+        return None
+    return pending
+
+
+def _queue_batch_request(spreadsheet_id: str, request: dict) -> int | None:
+    """Queue a batchUpdate request if a batch is open for the spreadsheet.
+    
+    Returns:
+        The number of queued requests, or None if no batch is open
+    """
+    pending = _open_batch(spreadsheet_id)
+    if pending is None:
+        return None
+    pending.append(request)
+    _PENDING_BATCHES[spreadsheet_id] = (time.monotonic(), creds, pending)
+    return len(pending)
+
+
 @simple_mcp.tool()
-async def set_basic_filter(spreadsheet_id: str, filter: dict) -> dict:
+async def set_basic_filter(spreadsheet_id: str, filter: dict, include_echo: bool = False) -> dict:
     """Set a basic filter on a sheet in a Google spreadsheet.
     
     Tool to set a basic filter on a sheet in a google spreadsheet. use when you need to filter or sort data within a specific range on a sheet.
+    While a batch is open for the spreadsheet (see begin_batch), the change is queued until commit_batch.
     
     Args:
         spreadsheet_id: The ID of the spreadsheet
@@ -4540,6 +4964,8 @@ async def set_basic_filter(spreadsheet_id: str, filter: dict) -> dict:
                 - end_column_index: The end column (0-based, exclusive) of the range
             - criteria: Optional filter criteria for specific columns
             - sort_specs: Optional sort specifications
+        include_echo: Whether to return the filter that was sent. Defaults to False, since the
+                      caller already has it; filter_details summarizes it either way.
     """
     # Check credentials first
     creds_valid, error_msg = check_credentials()
@@ -4609,24 +5035,38 @@ async def set_basic_filter(spreadsheet_id: str, filter: dict) -> dict:
             }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
+        
+        # Queue the request instead of sending it if a batch is open
+        set_filter_request = {
+            'setBasicFilter': {
+                'filter': filter
+            }
+        }
+        batch_size = _queue_batch_request(spreadsheet_id, set_filter_request)
+        if batch_size is not None:
+            return {
+                "successful": True,
+                "message": f"Queued basic filter for sheet {range_obj['sheet_id']} ({batch_size} request(s) pending); call commit_batch to apply",
+                "filter": filter if include_echo else None,
+                "filter_echo_omitted": not include_echo,
+                "spreadsheet_id": spreadsheet_id,
+                "queued": True,
+                "batch_size": batch_size
+            }
         
         # Prepare the request body
         request_body = {
-            'requests': [{
-                'setBasicFilter': {
-                    'filter': filter
-                }
-            }]
+            'requests': [set_filter_request]
         }
         
         # Execute the batch update
         try:
-            response = service.spreadsheets().batchUpdate(
+            response = await _execute(service.spreadsheets().batchUpdate(
                 spreadsheetId=spreadsheet_id,
                 body=request_body
-            ).execute()
+            ))
         except Exception as e:
             return {
                 "successful": False,
@@ -4639,7 +5079,8 @@ async def set_basic_filter(spreadsheet_id: str, filter: dict) -> dict:
         result = {
             "successful": True,
             "message": f"Successfully set basic filter on sheet {range_obj['sheet_id']}",
-            "filter": filter,
+            "filter": filter if include_echo else None,
+            "filter_echo_omitted": not include_echo,
             "spreadsheet_id": spreadsheet_id,
             "replies": response.get('replies', []),
             "updated_range": response.get('updatedRange'),
@@ -4648,25 +5089,30 @@ async def set_basic_filter(spreadsheet_id: str, filter: dict) -> dict:
             "updated_cells": response.get('updatedCells')
         }
         
+        # Read the range bounds once for the details and the description
+        start_row_index = range_obj.get('start_row_index', 0)
+        end_row_index = range_obj.get('end_row_index')
+        start_column_index = range_obj.get('start_column_index', 0)
+        end_column_index = range_obj.get('end_column_index')
+        
         # Add filter details
         result['filter_details'] = {
             "sheet_id": range_obj['sheet_id'],
-            "start_row_index": range_obj.get('start_row_index', 0),
-            "end_row_index": range_obj.get('end_row_index', None),
-            "start_column_index": range_obj.get('start_column_index', 0),
-            "end_column_index": range_obj.get('end_column_index', None),
+            "start_row_index": start_row_index,
+            "end_row_index": end_row_index,
+            "start_column_index": start_column_index,
+            "end_column_index": end_column_index,
             "has_criteria": 'criteria' in filter,
             "has_sort_specs": 'sortSpecs' in filter
         }
         
         # Add user-friendly description
-        if range_obj.get('end_row_index') and range_obj.get('end_column_index'):
-            start_row = range_obj['start_row_index'] + 1  # Convert to 1-based
-            end_row = range_obj['end_row_index']
-            start_col = chr(65 + range_obj['start_column_index'])  # Convert to letter
-            end_col = chr(64 + range_obj['end_column_index'])
+        if end_row_index and end_column_index:
+            start_row = start_row_index + 1  # Convert to 1-based
+            start_col = _column_letter(start_column_index)  # Convert to letters (A, ..., Z, AA, ...)
+            end_col = _column_letter(end_column_index - 1)
             
-            result['description'] = f"Filter applied to range {start_col}{start_row}:{end_col}{end_row}"
+            result['description'] = f"Filter applied to range {start_col}{start_row}:{end_col}{end_row_index}"
         else:
             result['description'] = f"Filter applied to entire sheet {range_obj['sheet_id']}"
         
@@ -4697,8 +5143,250 @@ async def set_basic_filter(spreadsheet_id: str, filter: dict) -> dict:
         }
 
 
+# Rows per values.update request when create_sheet_from_json writes large inputs
+_WRITE_CHUNK_ROWS = 5000
+
+
+def _resolve_import_path(path: str) -> Path:
+    """Resolve an NDJSON input path inside the directory named by GSHEETS_IMPORT_DIR.
+    
+    Relative paths are taken from that directory. Paths that lead outside it, through
+    '..' or a symlink, are rejected so tool calls can't upload arbitrary host files.
+    """
+    import_dir = os.getenv('GSHEETS_IMPORT_DIR')
+    if not import_dir:
+        raise ValueError("Reading sheet JSON from a file is disabled; set GSHEETS_IMPORT_DIR to the directory files may be read from")
+    base = Path(import_dir).resolve()
+    resolved = (base / path).resolve()
+    if not resolved.is_relative_to(base):
+        raise ValueError(f"Sheet JSON file must be inside {base}")
+    return resolved
+
+
+def _read_ndjson_records(path: Path):
+    """Yield the JSON value on each non-blank line of an NDJSON file"""
+    with open(path, encoding='utf-8') as ndjson_file:
+        for line in ndjson_file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _json_row_chunks(headers: list, items):
+    """Yield the header row followed by one row per item, in chunks of _WRITE_CHUNK_ROWS rows"""
+    chunk = [headers]
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            raise ValueError(f"Item at index {index} must be a dictionary")
+        # Each header's value as a string, with missing keys and None left blank
+        chunk.append(['' if (value := item.get(header)) is None else str(value) for header in headers])
+        if len(chunk) == _WRITE_CHUNK_ROWS:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _spanned_range(first_range: str, last_range: str) -> str:
+    """Combine the A1 ranges written by the first and last chunks into one range"""
+    sheet_part, _, first_cells = first_range.rpartition('!')
+    return f"{sheet_part}!{first_cells.partition(':')[0]}:{last_range.rpartition('!')[2].rpartition(':')[2]}"
+
+
+async def _stream_rows_to_sheet(service, spreadsheet_id: str, sheet_name: str, chunks, ctx: Context | None = None) -> tuple[int, str]:
+    """Write row chunks one after another, uploading each while the next one is built.
+    
+    When a tool context is given, the number of rows written so far is reported as
+    progress after each chunk, so clients can follow long writes as they happen.
+    
+    Returns:
+        Tuple of (total_rows_written, updated_range)
+    """
+    total_rows = 0
+    updated_ranges = []
+    pending = None
+    chunks = iter(chunks)
+    try:
+        # Chunks are built in a worker thread, since building them may read the input file
+        while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+            request = service.spreadsheets().values().update(
+                spreadsheetId=spreadsheet_id,
+                range=f"'{sheet_name}'!A{total_rows + 1}",
+                valueInputOption='USER_ENTERED',
+                body={
+                    'values': chunk
+                }
+            )
+            if pending is not None:
+                updated_ranges.append((await pending).get('updatedRange', ''))
+                if ctx is not None:
+                    await ctx.report_progress(total_rows)
+            total_rows += len(chunk)
+            pending = asyncio.ensure_future(_execute(request))
+        if pending is not None:
+            updated_ranges.append((await pending).get('updatedRange', ''))
+            pending = None
+            if ctx is not None:
+                await ctx.report_progress(total_rows, total_rows)
+    finally:
+        # Don't leave an upload running if reading the input failed
+        if pending is not None:
+            await asyncio.gather(pending, return_exceptions=True)
+    
+    return total_rows, _spanned_range(updated_ranges[0], updated_ranges[-1])
+
+
+@simple_mcp.tool()
+async def begin_batch(spreadsheet_id: str) -> dict:
+    """Start collecting changes to a spreadsheet so they are applied together in one request.
+    
+    While a batch is open, set_basic_filter and clear_basic_filter queue their changes for this
+    spreadsheet instead of sending them. Call commit_batch to apply everything in a single
+    batchUpdate, which is faster than one request per change, or discard_batch to drop the queue.
+    Only these two filter tools use the batch; every other tool applies its changes immediately.
+    A batch left unused for 5 minutes, or opened before re-authenticating, is discarded automatically.
+    
+    Args:
+        spreadsheet_id: The ID of the spreadsheet to batch changes for
+    """
+    # Check credentials first
+    creds_valid, error_msg = check_credentials()
+    if not creds_valid:
+        error_response = get_auth_error_response()
+        return {
+            "successful": False,
+            "message": error_response["message"],
+            "error": error_response["error"],
+            "instructions": error_response["instructions"]
+        }
+    
+    if not spreadsheet_id:
+        return {
+            "successful": False,
+            "message": "Error: Spreadsheet ID must be specified",
+            "error": "Missing spreadsheet ID"
+        }
+    
+    pending = _open_batch(spreadsheet_id)
+    if pending is None:
+        pending = []
+    _PENDING_BATCHES[spreadsheet_id] = (time.monotonic(), creds, pending)
+    return {
+        "successful": True,
+        "message": f"Batch open for spreadsheet {spreadsheet_id} ({len(pending)} request(s) pending)",
+        "spreadsheet_id": spreadsheet_id,
+        "batch_size": len(pending),
+        "expires_after_seconds": _BATCH_TTL
+    }
+
+
+@simple_mcp.tool()
+async def commit_batch(spreadsheet_id: str) -> dict:
+    """Apply all changes queued since begin_batch in a single batchUpdate and close the batch.
+    
+    The queued changes are applied atomically: if any of them is invalid, none are applied.
+    Only set_basic_filter and clear_basic_filter queue changes; other tools never wait for a commit.
+    A batch opened under different credentials is discarded instead of applied.
+    
+    Args:
+        spreadsheet_id: The ID of the spreadsheet whose batch should be applied
+    """
+    # Check credentials first
+    creds_valid, error_msg = check_credentials()
+    if not creds_valid:
+        error_response = get_auth_error_response()
+        return {
+            "successful": False,
+            "message": error_response["message"],
+            "error": error_response["error"],
+            "instructions": error_response["instructions"]
+        }
+    
+    entry = _PENDING_BATCHES.get(spreadsheet_id)
+    if entry is not None and entry[1] is not creds:
+        # Never send requests queued for one account with another account's credentials
+        del _PENDING_BATCHES[spreadsheet_id]
+        return {
+            "successful": False,
+            "message": f"Error: The batch for spreadsheet {spreadsheet_id} was opened under different credentials and has been discarded ({len(entry[2])} queued request(s) dropped)",
+            "spreadsheet_id": spreadsheet_id,
+            "requests_discarded": len(entry[2]),
+            "error": "Credentials changed"
+        }
+    
+    pending = _open_batch(spreadsheet_id)
+    _PENDING_BATCHES.pop(spreadsheet_id, None)
+    if pending is None:
+        return {
+            "successful": False,
+            "message": f"Error: No batch is open for spreadsheet {spreadsheet_id}. Call begin_batch first (unused batches expire after {_BATCH_TTL:.0f} seconds)",
+            "spreadsheet_id": spreadsheet_id,
+            "error": "No open batch"
+        }
+    
+    if not pending:
+        return {
+            "successful": True,
+            "message": "Batch closed; no changes were queued",
+            "spreadsheet_id": spreadsheet_id,
+            "requests_applied": 0,
+            "replies": []
+        }
+    
+    try:
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
+        
+        response = await _execute(service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={
+                'requests': pending
+            }
+        ))
+        
+        return {
+            "successful": True,
+            "message": f"Applied {len(pending)} queued request(s) in one batch update",
+            "spreadsheet_id": spreadsheet_id,
+            "requests_applied": len(pending),
+            "replies": response.get('replies', [])
+        }
+        
+    except Exception as e:
+        return {
+            "successful": False,
+            "message": f"Error applying batch: {str(e)}",
+            "spreadsheet_id": spreadsheet_id,
+            "requests_discarded": len(pending),
+            "error": str(e)
+        }
+
+
+@simple_mcp.tool()
+async def discard_batch(spreadsheet_id: str) -> dict:
+    """Close the open batch for a spreadsheet without applying the changes queued in it.
+    
+    Args:
+        spreadsheet_id: The ID of the spreadsheet whose batch should be discarded
+    """
+    entry = _PENDING_BATCHES.pop(spreadsheet_id, None)
+    if entry is None:
+        return {
+            "successful": False,
+            "message": f"Error: No batch is open for spreadsheet {spreadsheet_id}",
+            "spreadsheet_id": spreadsheet_id,
+            "error": "No open batch"
+        }
+    
+    return {
+        "successful": True,
+        "message": f"Discarded the batch for spreadsheet {spreadsheet_id} ({len(entry[2])} queued request(s) dropped)",
+        "spreadsheet_id": spreadsheet_id,
+        "requests_discarded": len(entry[2])
+    }
+
+
 @simple_mcp.tool()
-async def create_sheet_from_json(title: str, sheet_name: str, sheet_json: list) -> dict:
+async def create_sheet_from_json(title: str, sheet_name: str, sheet_json: list | None = None, sheet_json_path: str | None = None, include_echo: bool = False, ctx: Context | None = None) -> dict:
     """Create a new Google spreadsheet and populate its first worksheet from JSON data.
     
     Creates a new google spreadsheet and populates its first worksheet from `sheet json`, 
@@ -4709,6 +5397,13 @@ async def create_sheet_from_json(title: str, sheet_name: str, sheet_json: list)
         sheet_name: The name for the first worksheet/tab
         sheet_json: Array of objects where the first item's keys establish the headers. 
                    Each object should have the same keys as the first item.
+        sheet_json_path: Path to a local NDJSON file (one object per line) to read instead of sheet_json.
+                         The file is streamed to the sheet in chunks, so large inputs are never held in memory.
+                         It must be inside the directory set by the GSHEETS_IMPORT_DIR environment variable;
+                         relative paths are taken from that directory.
+        include_echo: Whether to list the headers in data_summary. Defaults to False, since they are the
+                      first item's keys; total_columns is always reported.
+        ctx: MCP context injected by FastMCP, used to report progress after each chunk of rows is written
     """
     # Check credentials first
     creds_valid, error_msg = check_credentials()
@@ -4738,7 +5433,30 @@ async def create_sheet_from_json(title: str, sheet_name: str, sheet_json: list)
             "error": "Missing sheet name"
         }
     
-    if not sheet_json:
+    records = None
+    if sheet_json_path:
+        # Read only the first record up front; the rest is streamed after the spreadsheet exists
+        try:
+            records = _read_ndjson_records(_resolve_import_path(sheet_json_path))
+            first_item = await asyncio.to_thread(next, records, None)
+        except Exception as e:
+            return {
+                "successful": False,
+                "message": f"Error reading sheet JSON file: {str(e)}",
+                "spreadsheet_id": None,
+                "error": str(e)
+            }
+        
+        if not isinstance(first_item, dict):
+            records.close()
+            return {
+                "successful": False,
+                "message": "Error: Sheet JSON file must start with a JSON object on its first non-blank line",
+                "spreadsheet_id": None,
+                "error": "Invalid sheet JSON file"
+            }
+    
+    elif not sheet_json:
         return {
             "successful": False,
             "message": "Error: Sheet JSON must be specified and non-empty",
@@ -4746,7 +5464,7 @@ async def create_sheet_from_json(title: str, sheet_name: str, sheet_json: list)
             "error": "Missing or empty sheet JSON"
         }
     
-    if not isinstance(sheet_json, list) or len(sheet_json) == 0:
+    elif not isinstance(sheet_json, list) or len(sheet_json) == 0:
         return {
             "successful": False,
             "message": "Error: Sheet JSON must be a non-empty array",
@@ -4754,21 +5472,25 @@ async def create_sheet_from_json(title: str, sheet_name: str, sheet_json: list)
             "error": "Invalid sheet JSON format"
         }
     
-    # Validate that all items are dictionaries
-    for i, item in enumerate(sheet_json):
-        if not isinstance(item, dict):
+    else:
+        # Validate that all items are dictionaries, stopping at the first that isn't
+        bad_index = next((i for i, item in enumerate(sheet_json) if not isinstance(item, dict)), None)
+        if bad_index is not None:
             return {
                 "successful": False,
-                "message": f"Error: Item at index {i} must be a dictionary",
+                "message": f"Error: Item at index {bad_index} must be a dictionary",
                 "spreadsheet_id": None,
-                "error": f"Invalid item type at index {i}"
+                "error": f"Invalid item type at index {bad_index}"
             }
+        
+        first_item = sheet_json[0]
     
     # Get headers from the first item
-    first_item = sheet_json[0]
     headers = list(first_item.keys())
     
     if not headers:
+        if records is not None:
+            records.close()
         return {
             "successful": False,
             "message": "Error: First item must have at least one key to establish headers",
@@ -4777,12 +5499,13 @@ async def create_sheet_from_json(title: str, sheet_name: str, sheet_json: list)
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
-        # Create the spreadsheet
+        # Create the spreadsheet with the header cells already formatted bold,
+        # so no separate formatting request is needed after the data is written
         try:
-            spreadsheet_response = service.spreadsheets().create(
+            spreadsheet_response = await _execute(service.spreadsheets().create(
                 body={
                     'properties': {
                         'title': title
@@ -4791,11 +5514,31 @@ async def create_sheet_from_json(title: str, sheet_name: str, sheet_json: list)
                         {
                             'properties': {
                                 'title': sheet_name
-                            }
+                            },
+                            'data': [
+                                {
+                                    'startRow': 0,
+                                    'startColumn': 0,
+                                    'rowData': [
+                                        {
+                                            'values': [
+                                                {
+                                                    'userEnteredFormat': {
+                                                        'textFormat': {
+                                                            'bold': True
+                                                        }
+                                                    }
+                                                }
+                                                for _ in headers
+                                            ]
+                                        }
+                                    ]
+                                }
+                            ]
                         }
                     ]
                 }
-            ).execute()
+            ))
         except Exception as e:
             return {
                 "successful": False,
@@ -4806,98 +5549,82 @@ async def create_sheet_from_json(title: str, sheet_name: str, sheet_json: list)
         
         spreadsheet_id = spreadsheet_response['spreadsheetId']
         
-        # Prepare the data for the sheet
-        # Start with headers
-        sheet_data = [headers]
-        
-        # Add data rows
-        for item in sheet_json:
-            row = []
-            for header in headers:
-                # Get value for this header, convert to string, handle None
-                value = item.get(header, '')
-                if value is None:
-                    value = ''
-                row.append(str(value))
-            sheet_data.append(row)
-        
-        # Update the sheet with data
-        try:
-            update_response = service.spreadsheets().values().update(
-                spreadsheetId=spreadsheet_id,
-                range=f"'{sheet_name}'!A1",
-                valueInputOption='USER_ENTERED',
-                body={
-                    'values': sheet_data
+        # Stream NDJSON input chunk by chunk, holding at most two chunks in memory
+        if records is not None:
+            try:
+                total_rows, updated_range = await _stream_rows_to_sheet(
+                    service, spreadsheet_id, sheet_name,
+                    _json_row_chunks(headers, itertools.chain((first_item,), records)),
+                    ctx
+                )
+            except Exception as e:
+                return {
+                    "successful": False,
+                    "message": f"Error populating sheet with data: {str(e)}",
+                    "spreadsheet_id": spreadsheet_id,
+                    "error": str(e)
                 }
-            ).execute()
-        except Exception as e:
-            return {
-                "successful": False,
-                "message": f"Error populating sheet with data: {str(e)}",
-                "spreadsheet_id": spreadsheet_id,
-                "error": str(e)
-            }
         
-        # Get the updated range
-        updated_range = update_response.get('updatedRange', '')
-        
-        # Format the headers (make them bold)
-        try:
-            format_response = service.spreadsheets().batchUpdate(
-                spreadsheetId=spreadsheet_id,
-                body={
-                    'requests': [
-                        {
-                            'repeatCell': {
-                                'range': {
-                                    'sheetId': spreadsheet_response['sheets'][0]['properties']['sheetId'],
-                                    'startRowIndex': 0,
-                                    'endRowIndex': 1
-                                },
-                                'cell': {
-                                    'userEnteredFormat': {
-                                        'textFormat': {
-                                            'bold': True
-                                        }
-                                    }
-                                },
-                                'fields': 'userEnteredFormat.textFormat.bold'
-                            }
+        # Update the sheet with data. Large inputs are split into row chunks written
+        # concurrently to their own ranges, so no single huge request body is built.
+        else:
+            chunks = list(_json_row_chunks(headers, sheet_json))
+            total_rows = sum(map(len, chunks))
+            
+            try:
+                if len(chunks) == 1:
+                    update_response = await _execute(service.spreadsheets().values().update(
+                        spreadsheetId=spreadsheet_id,
+                        range=f"'{sheet_name}'!A1",
+                        valueInputOption='USER_ENTERED',
+                        body={
+                            'values': chunks[0]
                         }
+                    ))
+                    updated_range = update_response.get('updatedRange', '')
+                else:
+                    requests = [
+                        service.spreadsheets().values().update(
+                            spreadsheetId=spreadsheet_id,
+                            range=f"'{sheet_name}'!A{index * _WRITE_CHUNK_ROWS + 1}",
+                            valueInputOption='USER_ENTERED',
+                            body={
+                                'values': chunk
+                            }
+                        )
+                        for index, chunk in enumerate(chunks)
                     ]
+                    update_responses = await _execute_concurrently(*requests)
+                    
+                    # Span the ranges of the first and last chunks
+                    updated_range = _spanned_range(
+                        update_responses[0].get('updatedRange', ''),
+                        update_responses[-1].get('updatedRange', '')
+                    )
+            except Exception as e:
+                return {
+                    "successful": False,
+                    "message": f"Error populating sheet with data: {str(e)}",
+                    "spreadsheet_id": spreadsheet_id,
+                    "error": str(e)
                 }
-            ).execute()
-        except Exception as e:
-            # Non-critical error, continue without formatting
-            pass
         
-        # Get spreadsheet info
-        try:
-            spreadsheet_info = service.spreadsheets().get(
-                spreadsheetId=spreadsheet_id,
-                ranges=[],
-                includeGridData=False
-            ).execute()
-            
-            spreadsheet_title = spreadsheet_info.get('properties', {}).get('title', title)
-            sheet_count = len(spreadsheet_info.get('sheets', []))
-        except Exception:
-            spreadsheet_title = title
-            sheet_count = 1
+        # The create response already describes the new spreadsheet
+        spreadsheet_title = spreadsheet_response.get('properties', {}).get('title', title)
+        sheet_count = len(spreadsheet_response.get('sheets', [])) or 1
         
         return {
             "successful": True,
-            "message": f"Successfully created spreadsheet '{spreadsheet_title}' with {len(sheet_data) - 1} data rows",
+            "message": f"Successfully created spreadsheet '{spreadsheet_title}' with {total_rows - 1} data rows",
             "spreadsheet_id": spreadsheet_id,
             "spreadsheet_title": spreadsheet_title,
             "sheet_name": sheet_name,
             "web_view_link": f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/edit",
             "data_summary": {
-                "total_rows": len(sheet_data),
-                "data_rows": len(sheet_data) - 1,
+                "total_rows": total_rows,
+                "data_rows": total_rows - 1,
                 "total_columns": len(headers),
-                "headers": headers,
+                "headers": headers if include_echo else None,
                 "updated_range": updated_range
             },
             "sheet_count": sheet_count,
@@ -4975,33 +5702,30 @@ async def copy_sheet_to_another_spreadsheet(spreadsheet_id: str, sheet_id: int,
         }
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
-        
-        # First, get information about the source sheet to validate it exists
-        try:
-            source_spreadsheet_info = service.spreadsheets().get(
-                spreadsheetId=spreadsheet_id,
-                ranges=[],
-                includeGridData=False
-            ).execute()
-        except Exception as e:
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
+        
+        # Fetch the source and destination sheet lists together to validate both exist.
+        # The destination list is always fetched fresh, since the copy's title must not
+        # collide with a sheet someone else added since it was cached.
+        _invalidate_spreadsheet_meta(destination_spreadsheet_id)
+        source_spreadsheet_info, destination_spreadsheet_info = await _get_spreadsheet_metas(
+            service, spreadsheet_id, destination_spreadsheet_id
+        )
+        
+        if isinstance(source_spreadsheet_info, Exception):
             return {
                 "successful": False,
-                "message": f"Error accessing source spreadsheet: {str(e)}",
+                "message": f"Error accessing source spreadsheet: {str(source_spreadsheet_info)}",
                 "source_spreadsheet_id": spreadsheet_id,
                 "destination_spreadsheet_id": destination_spreadsheet_id,
-                "error": str(e)
+                "error": str(source_spreadsheet_info)
             }
         
         # Find the source sheet
-        source_sheet = None
-        source_sheet_title = None
-        for sheet in source_spreadsheet_info.get('sheets', []):
-            if sheet['properties']['sheetId'] == sheet_id:
-                source_sheet = sheet
-                source_sheet_title = sheet['properties']['title']
-                break
+        sheets_by_id = {sheet['properties']['sheetId']: sheet for sheet in source_spreadsheet_info.get('sheets', [])}
+        source_sheet = sheets_by_id.get(sheet_id)
+        source_sheet_title = source_sheet['properties']['title'] if source_sheet else None
         
         if not source_sheet:
             available_sheets = [f"{sheet['properties']['title']} (ID: {sheet['properties']['sheetId']})" 
@@ -5016,24 +5740,18 @@ async def copy_sheet_to_another_spreadsheet(spreadsheet_id: str, sheet_id: int,
             }
         
         # Validate destination spreadsheet exists
-        try:
-            destination_spreadsheet_info = service.spreadsheets().get(
-                spreadsheetId=destination_spreadsheet_id,
-                ranges=[],
-                includeGridData=False
-            ).execute()
-        except Exception as e:
+        if isinstance(destination_spreadsheet_info, Exception):
             return {
                 "successful": False,
-                "message": f"Error accessing destination spreadsheet: {str(e)}",
+                "message": f"Error accessing destination spreadsheet: {str(destination_spreadsheet_info)}",
                 "source_spreadsheet_id": spreadsheet_id,
                 "destination_spreadsheet_id": destination_spreadsheet_id,
-                "error": str(e)
+                "error": str(destination_spreadsheet_info)
             }
         
         # Check if destination spreadsheet already has a sheet with the same name
-        destination_sheet_names = [sheet['properties']['title'] 
-                                 for sheet in destination_spreadsheet_info.get('sheets', [])]
+        destination_sheet_names = {sheet['properties']['title'] 
+                                   for sheet in destination_spreadsheet_info.get('sheets', [])}
         
         # Generate a unique name if there's a conflict
         new_sheet_title = source_sheet_title
@@ -5044,13 +5762,14 @@ async def copy_sheet_to_another_spreadsheet(spreadsheet_id: str, sheet_id: int,
         
         # Copy the sheet to the destination spreadsheet
         try:
-            copy_response = service.spreadsheets().sheets().copyTo(
+            copy_response = await _execute(service.spreadsheets().sheets().copyTo(
                 spreadsheetId=spreadsheet_id,
                 sheetId=sheet_id,
                 body={
                     'destinationSpreadsheetId': destination_spreadsheet_id
                 }
-            ).execute()
+            ))
+            _invalidate_spreadsheet_meta(destination_spreadsheet_id)
         except Exception as e:
             return {
                 "successful": False,
@@ -5066,7 +5785,7 @@ async def copy_sheet_to_another_spreadsheet(spreadsheet_id: str, sheet_id: int,
         # Update the sheet title if it was changed due to naming conflict
         if new_sheet_title != source_sheet_title:
             try:
-                service.spreadsheets().batchUpdate(
+                await _execute(service.spreadsheets().batchUpdate(
                     spreadsheetId=destination_spreadsheet_id,
                     body={
                         'requests': [
@@ -5081,24 +5800,15 @@ async def copy_sheet_to_another_spreadsheet(spreadsheet_id: str, sheet_id: int,
                             }
                         ]
                     }
-                ).execute()
+                ))
+                _invalidate_spreadsheet_meta(destination_spreadsheet_id)
             except Exception as e:
                 # Non-critical error, continue without renaming
                 pass
         
-        # Get updated destination spreadsheet info
-        try:
-            updated_destination_info = service.spreadsheets().get(
-                spreadsheetId=destination_spreadsheet_id,
-                ranges=[],
-                includeGridData=False
-            ).execute()
-            
-            destination_title = updated_destination_info.get('properties', {}).get('title', 'Unknown')
-            total_sheets = len(updated_destination_info.get('sheets', []))
-        except Exception:
-            destination_title = "Unknown"
-            total_sheets = len(destination_sheet_names) + 1
+        # The destination now holds its previous sheets plus the copy
+        destination_title = destination_spreadsheet_info.get('properties', {}).get('title', 'Unknown')
+        total_sheets = len(destination_sheet_names) + 1
         
         return {
             "successful": True,
@@ -5131,8 +5841,28 @@ async def copy_sheet_to_another_spreadsheet(spreadsheet_id: str, sheet_id: int,
         }
 
 
+# Accepted values for append_values_to_spreadsheet's API options
+_VALUE_INPUT_OPTIONS = ("RAW", "USER_ENTERED")
+_INSERT_DATA_OPTIONS = ("OVERWRITE", "INSERT_ROWS")
+_MAJOR_DIMENSIONS = ("ROWS", "COLUMNS")
+_VALUE_RENDER_OPTIONS = ("FORMATTED_VALUE", "UNFORMATTED_VALUE", "FORMULA")
+_DATETIME_RENDER_OPTIONS = ("SERIAL_NUMBER", "FORMATTED_STRING")
+
+def _error_response(message: str, error: str, id_key: str = "spreadsheetId", spreadsheet_id: str | None = None) -> dict:
+    """Build a failed tool response; id_key is the spelling of the spreadsheet ID key the tool uses"""
+    return {"successful": False, "message": message, id_key: spreadsheet_id, "error": error}
+
+
+def _invalid_option_response(checks: tuple) -> dict | None:
+    """Return the error response for the first (name, value, allowed values) check that fails, or None"""
+    for name, value, allowed in checks:
+        if value not in allowed:
+            return _error_response(f"Error: {name} must be one of {list(allowed)}", f"Invalid {name}: {value}")
+    return None
+
+
 @simple_mcp.tool()
-async def append_values_to_spreadsheet(spreadsheetId: str, range: str, values: list, valueInputOption: str = "USER_ENTERED", insertDataOption: str = "INSERT_ROWS", majorDimension: str = "ROWS", includeValuesInResponse: bool = False, responseValueRenderOption: str = "UNFORMATTED_VALUE", responseDateTimeRenderOption: str = "SERIAL_NUMBER") -> dict:
+async def append_values_to_spreadsheet(spreadsheetId: str, range: str, values: list, valueInputOption: str = "USER_ENTERED", insertDataOption: str = "INSERT_ROWS", majorDimension: str = "ROWS", includeValuesInResponse: bool = False, responseValueRenderOption: str = "UNFORMATTED_VALUE", responseDateTimeRenderOption: str = "SERIAL_NUMBER", include_echo: bool = False) -> dict:
     """Append values to a spreadsheet.
     
     Tool to append values to a spreadsheet. use when you need to add new data 
@@ -5149,159 +5879,94 @@ async def append_values_to_spreadsheet(spreadsheetId: str, range: str, values: l
         includeValuesInResponse: Determines if the update response should include the values
         responseValueRenderOption: Determines how values in the response should be rendered
         responseDateTimeRenderOption: Determines how dates, times, and durations in the response should be rendered
+        include_echo: Whether to return the input values in append_details. Defaults to False, since
+                      the caller already has them; total_rows_appended gives their count either way.
     """
     # Check credentials first
     creds_valid, error_msg = check_credentials()
     if not creds_valid:
-        error_response = get_auth_error_response()
-        return {
-            "successful": False,
-            "message": error_response["message"],
-            "error": error_response["error"],
-            "instructions": error_response["instructions"],
-            "spreadsheetId": None
-        }
+        return {**get_auth_error_response(), "spreadsheetId": None}
     
     if not spreadsheetId:
-        return {
-            "successful": False,
-            "message": "Error: Spreadsheet ID must be specified",
-            "spreadsheetId": None,
-            "error": "Missing spreadsheet ID"
-        }
+        return _error_response("Error: Spreadsheet ID must be specified", "Missing spreadsheet ID")
     
     if not range:
-        return {
-            "successful": False,
-            "message": "Error: Range must be specified",
-            "spreadsheetId": None,
-            "error": "Missing range"
-        }
+        return _error_response("Error: Range must be specified", "Missing range")
     
     if not values:
-        return {
-            "successful": False,
-            "message": "Error: Values must be specified",
-            "spreadsheetId": None,
-            "error": "Missing values"
-        }
+        return _error_response("Error: Values must be specified", "Missing values")
     
     if not isinstance(values, list):
-        return {
-            "successful": False,
-            "message": "Error: Values must be an array",
-            "spreadsheetId": None,
-            "error": "Invalid values format"
-        }
-    
-    # Validate valueInputOption
-    valid_value_input_options = ["RAW", "USER_ENTERED"]
-    if valueInputOption not in valid_value_input_options:
-        return {
-            "successful": False,
-            "message": f"Error: valueInputOption must be one of {valid_value_input_options}",
-            "spreadsheetId": None,
-            "error": f"Invalid valueInputOption: {valueInputOption}"
-        }
-    
-    # Validate insertDataOption
-    valid_insert_data_options = ["OVERWRITE", "INSERT_ROWS"]
-    if insertDataOption not in valid_insert_data_options:
-        return {
-            "successful": False,
-            "message": f"Error: insertDataOption must be one of {valid_insert_data_options}",
-            "spreadsheetId": None,
-            "error": f"Invalid insertDataOption: {insertDataOption}"
-        }
-    
-    # Validate majorDimension
-    valid_major_dimensions = ["ROWS", "COLUMNS"]
-    if majorDimension not in valid_major_dimensions:
-        return {
-            "successful": False,
-            "message": f"Error: majorDimension must be one of {valid_major_dimensions}",
-            "spreadsheetId": None,
-            "error": f"Invalid majorDimension: {majorDimension}"
-        }
-    
-    # Validate responseValueRenderOption
-    valid_response_value_render_options = ["FORMATTED_VALUE", "UNFORMATTED_VALUE", "FORMULA"]
-    if responseValueRenderOption not in valid_response_value_render_options:
-        return {
-            "successful": False,
-            "message": f"Error: responseValueRenderOption must be one of {valid_response_value_render_options}",
-            "spreadsheetId": None,
-            "error": f"Invalid responseValueRenderOption: {responseValueRenderOption}"
-        }
-    
-    # Validate responseDateTimeRenderOption
-    valid_response_datetime_render_options = ["SERIAL_NUMBER", "FORMATTED_STRING"]
-    if responseDateTimeRenderOption not in valid_response_datetime_render_options:
-        return {
-            "successful": False,
-            "message": f"Error: responseDateTimeRenderOption must be one of {valid_response_datetime_render_options}",
-            "spreadsheetId": None,
-            "error": f"Invalid responseDateTimeRenderOption: {responseDateTimeRenderOption}"
-        }
+        return _error_response("Error: Values must be an array", "Invalid values format")
+    
+    # Validate the enumerated options
+    invalid_option = _invalid_option_response((
+        ("valueInputOption", valueInputOption, _VALUE_INPUT_OPTIONS),
+        ("insertDataOption", insertDataOption, _INSERT_DATA_OPTIONS),
+        ("majorDimension", majorDimension, _MAJOR_DIMENSIONS),
+        ("responseValueRenderOption", responseValueRenderOption, _VALUE_RENDER_OPTIONS),
+        ("responseDateTimeRenderOption", responseDateTimeRenderOption, _DATETIME_RENDER_OPTIONS)
+    ))
+    if invalid_option:
+        return invalid_option
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
-        # Validate spreadsheet exists
-        try:
-            spreadsheet_info = service.spreadsheets().get(
-                spreadsheetId=spreadsheetId,
-                ranges=[],
-                includeGridData=False
-            ).execute()
-        except Exception as e:
-            return {
-                "successful": False,
-                "message": f"Error accessing spreadsheet: {str(e)}",
-                "spreadsheetId": spreadsheetId,
-                "error": str(e)
-            }
-        
-        # Prepare the request body
-        request_body = {
-            'values': values
-        }
-        
-        # Append values to the spreadsheet
-        try:
-            response = service.spreadsheets().values().append(
+        def append_request(chunk):
+            return service.spreadsheets().values().append(
                 spreadsheetId=spreadsheetId,
                 range=range,
                 valueInputOption=valueInputOption,
                 insertDataOption=insertDataOption,
-                body=request_body,
+                body={'values': chunk},
                 includeValuesInResponse=includeValuesInResponse,
                 responseValueRenderOption=responseValueRenderOption,
                 responseDateTimeRenderOption=responseDateTimeRenderOption
-            ).execute()
-        except Exception as e:
-            return {
-                "successful": False,
-                "message": f"Error appending values: {str(e)}",
-                "spreadsheetId": spreadsheetId,
-                "error": str(e)
-            }
+            )
         
-        # Extract response data
-        updates = response.get('updates', {})
-        updated_range = updates.get('updatedRange', '')
-        updated_rows = updates.get('updatedRows', 0)
-        updated_columns = updates.get('updatedColumns', 0)
-        updated_cells = updates.get('updatedCells', 0)
+        # Large row payloads are appended in chunks of _WRITE_CHUNK_ROWS rows so no single request
+        # grows too big. The chunks go one after another, since each append lands after the rows
+        # already in the table and concurrent appends could interleave.
+        if majorDimension == "ROWS" and len(values) > _WRITE_CHUNK_ROWS:
+            chunks = list(itertools.batched(values, _WRITE_CHUNK_ROWS))
+        else:
+            chunks = [values]
+        
+        # Append the first chunk, looking up the title alongside it (cached for later calls).
+        # A missing spreadsheet surfaces as a 404 from the operation itself.
+        responses = []
+        try:
+            response, spreadsheet_title = await asyncio.gather(
+                _execute(append_request(chunks[0])),
+                _get_spreadsheet_title(service, spreadsheetId)
+            )
+            responses.append(response)
+            for chunk in chunks[1:]:
+                responses.append(await _execute(append_request(chunk)))
+        except Exception as e:
+            if _is_not_found(e):
+                return _error_response(f"Error accessing spreadsheet: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
+            message = f"Error appending values: {str(e)}"
+            rows_appended = sum(response.get('updates', {}).get('updatedRows', 0) for response in responses)
+            if rows_appended:
+                message += f" ({rows_appended} row(s) were appended before the error)"
+            return _error_response(message, str(e), spreadsheet_id=spreadsheetId)
+        
+        # Extract response data, combining the updates of all chunks
+        all_updates = [response.get('updates', {}) for response in responses]
+        updated_range = all_updates[0].get('updatedRange', '')
+        if len(all_updates) > 1 and updated_range and all_updates[-1].get('updatedRange'):
+            updated_range = _spanned_range(updated_range, all_updates[-1]['updatedRange'])
+        updated_rows = sum(updates.get('updatedRows', 0) for updates in all_updates)
+        updated_columns = max(updates.get('updatedColumns', 0) for updates in all_updates)
+        updated_cells = sum(updates.get('updatedCells', 0) for updates in all_updates)
         
         # Get appended values if requested
         appended_values = None
-        if includeValuesInResponse and 'updatedData' in updates:
-            appended_values = updates['updatedData'].get('values', [])
-        
-        # Get spreadsheet title
-        spreadsheet_title = spreadsheet_info.get('properties', {}).get('title', 'Unknown')
+        if includeValuesInResponse and 'updatedData' in all_updates[0]:
+            appended_values = [row for updates in all_updates for row in updates.get('updatedData', {}).get('values', [])]
         
         return {
             "successful": True,
@@ -5320,7 +5985,7 @@ async def append_values_to_spreadsheet(spreadsheetId: str, range: str, values: l
             "web_view_link": f"https://docs.google.com/spreadsheets/d/{spreadsheetId}/edit",
             "append_details": {
                 "total_rows_appended": len(values),
-                "input_values": values,
+                "input_values": values if include_echo else None,
                 "response_metadata": {
                     "responseValueRenderOption": responseValueRenderOption,
                     "responseDateTimeRenderOption": responseDateTimeRenderOption
@@ -5329,12 +5994,99 @@ async def append_values_to_spreadsheet(spreadsheetId: str, range: str, values: l
         }
         
     except Exception as e:
-        return {
-            "successful": False,
-            "message": f"Error appending values to spreadsheet: {str(e)}",
-            "spreadsheetId": spreadsheetId,
-            "error": str(e)
-        }
+        return _error_response(f"Error appending values to spreadsheet: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
+
+
+# A1 cell reference such as "B12", matched at the start of the cell string
+_A1_CELL_RE = re.compile(r'([A-Z]+)(\d+)')
+
+def _parse_cell(cell: str) -> tuple[int, int]:
+    """Convert an A1 cell reference to 1-based (row, column), or (1, 1) if it cannot be parsed"""
+    match = _A1_CELL_RE.match(cell.upper())
+    if not match:
+        return 1, 1
+    col_str, row_str = match.groups()
+    # Convert column letters to number
+    col_num = 0
+    for char in col_str:
+        col_num = col_num * 26 + (ord(char) - 64)
+    return int(row_str), col_num
+
+
+def _a1_box(range_str: str) -> tuple | None:
+    """Return (sheet, start_row, start_col, end_row, end_col) for a 'Sheet!A1:B2' or 'Sheet!A1' range, else None"""
+    sheet_part, separator, cells = range_str.rpartition('!')
+    start_cell, _, end_cell = cells.partition(':')
+    end_cell = end_cell or start_cell
+    if not separator or not _A1_CELL_RE.fullmatch(start_cell.upper()) or not _A1_CELL_RE.fullmatch(end_cell.upper()):
+        return None
+    start_row, start_col = _parse_cell(start_cell)
+    end_row, end_col = _parse_cell(end_cell)
+    return (sheet_part.strip("'"), min(start_row, end_row), min(start_col, end_col), max(start_row, end_row), max(start_col, end_col))
+
+
+def _minimal_a1_ranges(ranges: list) -> list:
+    """Drop ranges that repeat or lie inside another range of the same sheet, keeping the input order.
+    
+    Only 'Sheet!A1:B2' style ranges are compared by area. Overlapping ranges are not merged, since
+    their bounding box would cover cells that neither range includes.
+    """
+    unique_ranges = list(dict.fromkeys(ranges))
+    boxes = [_a1_box(range_str) for range_str in unique_ranges]
+    
+    # Group the comparable ranges by sheet
+    indices_by_sheet = {}
+    for index, box in enumerate(boxes):
+        if box:
+            indices_by_sheet.setdefault(box[0], []).append(index)
+    
+    # A range is redundant if another range contains it; of identical boxes the first is kept
+    redundant = set()
+    for indices in indices_by_sheet.values():
+        for index in indices:
+            _, top, left, bottom, right = boxes[index]
+            for other in indices:
+                _, other_top, other_left, other_bottom, other_right = boxes[other]
+                if (other != index and other_top <= top and other_left <= left and other_bottom >= bottom and other_right >= right
+                        and (boxes[other] != boxes[index] or other < index)):
+                    redundant.add(index)
+                    break
+    
+    return [range_str for index, range_str in enumerate(unique_ranges) if index not in redundant]
+
+
+
+def _cleared_range_detail(cleared_range: str) -> dict:
+    """Describe a cleared A1 range with its sheet name and estimated cell count"""
+    try:
+        # Extract sheet name and range
+        sheet_part, separator, range_part = cleared_range.partition('!')
+        if separator:
+            sheet_name = sheet_part.strip("'")
+        else:
+            sheet_name = "Sheet1"  # Default sheet
+            range_part = cleared_range
+        
+        # Parse range to get dimensions
+        if ':' in range_part:
+            start_cell, end_cell = range_part.split(':')
+            start_row, start_col = _parse_cell(start_cell)
+            end_row, end_col = _parse_cell(end_cell)
+            cells_in_range = (end_row - start_row + 1) * (end_col - start_col + 1)
+        else:
+            # Single cell
+            cells_in_range = 1
+        
+        return {"range": cleared_range, "sheet_name": sheet_name, "estimated_cells": cells_in_range}
+    except Exception:
+        # If parsing fails, assume at least 1 cell
+        return {"range": cleared_range, "sheet_name": "Unknown", "estimated_cells": 1}
+
+
+def _cleared_range_details(cleared_ranges: list) -> tuple[list, int]:
+    """Return the details of each cleared range and the estimated total number of cells cleared"""
+    range_details = [_cleared_range_detail(cleared_range) for cleared_range in cleared_ranges]
+    return range_details, sum(detail["estimated_cells"] for detail in range_details)
 
 
 @simple_mcp.tool()
@@ -5351,165 +6103,58 @@ async def batch_clear_spreadsheet_values(spreadsheet_id: str, ranges: list) -> d
     # Check credentials first
     creds_valid, error_msg = check_credentials()
     if not creds_valid:
-        error_response = get_auth_error_response()
-        return {
-            "successful": False,
-            "message": error_response["message"],
-            "error": error_response["error"],
-            "instructions": error_response["instructions"],
-            "spreadsheet_id": None
-        }
+        return {**get_auth_error_response(), "spreadsheet_id": None}
     
     if not spreadsheet_id:
-        return {
-            "successful": False,
-            "message": "Error: Spreadsheet ID must be specified",
-            "spreadsheet_id": None,
-            "error": "Missing spreadsheet ID"
-        }
+        return _error_response("Error: Spreadsheet ID must be specified", "Missing spreadsheet ID", id_key="spreadsheet_id")
     
     if not ranges:
-        return {
-            "successful": False,
-            "message": "Error: Ranges must be specified",
-            "spreadsheet_id": None,
-            "error": "Missing ranges"
-        }
+        return _error_response("Error: Ranges must be specified", "Missing ranges", id_key="spreadsheet_id")
     
     if not isinstance(ranges, list):
-        return {
-            "successful": False,
-            "message": "Error: Ranges must be an array",
-            "spreadsheet_id": None,
-            "error": "Invalid ranges format"
-        }
+        return _error_response("Error: Ranges must be an array", "Invalid ranges format", id_key="spreadsheet_id")
     
     if len(ranges) == 0:
-        return {
-            "successful": False,
-            "message": "Error: At least one range must be specified",
-            "spreadsheet_id": None,
-            "error": "Empty ranges array"
-        }
+        return _error_response("Error: At least one range must be specified", "Empty ranges array", id_key="spreadsheet_id")
     
     # Validate that all ranges are strings
     for i, range_item in enumerate(ranges):
         if not isinstance(range_item, str):
-            return {
-                "successful": False,
-                "message": f"Error: Range at index {i} must be a string",
-                "spreadsheet_id": None,
-                "error": f"Invalid range type at index {i}"
-            }
+            return _error_response(f"Error: Range at index {i} must be a string", f"Invalid range type at index {i}", id_key="spreadsheet_id")
         if not range_item.strip():
-            return {
-                "successful": False,
-                "message": f"Error: Range at index {i} cannot be empty",
-                "spreadsheet_id": None,
-                "error": f"Empty range at index {i}"
-            }
+            return _error_response(f"Error: Range at index {i} cannot be empty", f"Empty range at index {i}", id_key="spreadsheet_id")
+    
+    # Ranges that repeat or lie inside another range add nothing to the clear
+    ranges_to_clear = _minimal_a1_ranges(ranges)
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
-        # Validate spreadsheet exists
+        # Clear the specified ranges, looking up the title alongside it (cached for later calls).
+        # A missing spreadsheet surfaces as a 404 from the operation itself.
         try:
-            spreadsheet_info = service.spreadsheets().get(
-                spreadsheetId=spreadsheet_id,
-                ranges=[],
-                includeGridData=False
-            ).execute()
-        except Exception as e:
-            return {
-                "successful": False,
-                "message": f"Error accessing spreadsheet: {str(e)}",
-                "spreadsheet_id": spreadsheet_id,
-                "error": str(e)
-            }
-        
-        # Get spreadsheet title
-        spreadsheet_title = spreadsheet_info.get('properties', {}).get('title', 'Unknown')
-        
-        # Clear the specified ranges
-        try:
-            response = service.spreadsheets().values().batchClear(
-                spreadsheetId=spreadsheet_id,
-                body={
-                    'ranges': ranges
-                }
-            ).execute()
+            response, spreadsheet_title = await asyncio.gather(
+                _execute(service.spreadsheets().values().batchClear(
+                    spreadsheetId=spreadsheet_id,
+                    body={
+                        'ranges': ranges_to_clear
+                    }
+                )),
+                _get_spreadsheet_title(service, spreadsheet_id)
+            )
         except Exception as e:
-            return {
-                "successful": False,
-                "message": f"Error clearing ranges: {str(e)}",
-                "spreadsheet_id": spreadsheet_id,
-                "error": str(e)
-            }
+            if _is_not_found(e):
+                return _error_response(f"Error accessing spreadsheet: {str(e)}", str(e), id_key="spreadsheet_id", spreadsheet_id=spreadsheet_id)
+            return _error_response(f"Error clearing ranges: {str(e)}", str(e), id_key="spreadsheet_id", spreadsheet_id=spreadsheet_id)
         
         # Extract response data
         cleared_ranges = response.get('clearedRanges', [])
         spreadsheet_id_response = response.get('spreadsheetId', spreadsheet_id)
         
         # Count total cells cleared
-        total_cells_cleared = 0
-        range_details = []
-        
-        for cleared_range in cleared_ranges:
-            # Parse the range to estimate cell count
-            try:
-                # Extract sheet name and range
-                if '!' in cleared_range:
-                    sheet_part, range_part = cleared_range.split('!', 1)
-                    sheet_name = sheet_part.strip("'")
-                else:
-                    sheet_name = "Sheet1"  # Default sheet
-                    range_part = cleared_range
-                
-                # Parse range to get dimensions
-                if ':' in range_part:
-                    start_cell, end_cell = range_part.split(':')
-                    
-                    # Convert A1 notation to row/column indices
-                    def parse_cell(cell):
-                        import re
-                        match = re.match(r'([A-Z]+)(\d+)', cell.upper())
-                        if match:
-                            col_str, row_str = match.groups()
-                            # Convert column letters to number
-                            col_num = 0
-                            for char in col_str:
-                                col_num = col_num * 26 + (ord(char) - ord('A') + 1)
-                            return int(row_str), col_num
-                        return 1, 1
-                    
-                    start_row, start_col = parse_cell(start_cell)
-                    end_row, end_col = parse_cell(end_cell)
-                    
-                    # Calculate cell count
-                    rows = end_row - start_row + 1
-                    cols = end_col - start_col + 1
-                    cells_in_range = rows * cols
-                else:
-                    # Single cell
-                    cells_in_range = 1
-                
-                total_cells_cleared += cells_in_range
-                
-                range_details.append({
-                    "range": cleared_range,
-                    "sheet_name": sheet_name,
-                    "estimated_cells": cells_in_range
-                })
-                
-            except Exception:
-                # If parsing fails, assume at least 1 cell
-                total_cells_cleared += 1
-                range_details.append({
-                    "range": cleared_range,
-                    "sheet_name": "Unknown",
-                    "estimated_cells": 1
-                })
+        range_details, total_cells_cleared = _cleared_range_details(cleared_ranges)
+        cleared_range_set = set(cleared_ranges)
         
         return {
             "successful": True,
@@ -5523,18 +6168,14 @@ async def batch_clear_spreadsheet_values(spreadsheet_id: str, ranges: list) -> d
             "web_view_link": f"https://docs.google.com/spreadsheets/d/{spreadsheet_id_response}/edit",
             "clear_details": {
                 "input_ranges": ranges,
+                "redundant_ranges_skipped": len(ranges) - len(ranges_to_clear),
                 "successful_ranges": cleared_ranges,
-                "failed_ranges": [r for r in ranges if r not in cleared_ranges] if len(cleared_ranges) < len(ranges) else []
+                "failed_ranges": [r for r in ranges_to_clear if r not in cleared_range_set] if len(cleared_range_set) < len(ranges_to_clear) else []
             }
         }
         
     except Exception as e:
-        return {
-            "successful": False,
-            "message": f"Error batch clearing spreadsheet values: {str(e)}",
-            "spreadsheet_id": spreadsheet_id,
-            "error": str(e)
-        }
+        return _error_response(f"Error batch clearing spreadsheet values: {str(e)}", str(e), id_key="spreadsheet_id", spreadsheet_id=spreadsheet_id)
 
 
 @simple_mcp.tool()
@@ -5554,51 +6195,30 @@ async def batch_clear_values_by_data_filter(spreadsheetId: str, dataFilters: lis
     # Check credentials first
     creds_valid, error_msg = check_credentials()
     if not creds_valid:
-        error_response = get_auth_error_response()
-        return {
-            "successful": False,
-            "message": error_response["message"],
-            "error": error_response["error"],
-            "instructions": error_response["instructions"],
-            "spreadsheetId": None
-        }
+        return {**get_auth_error_response(), "spreadsheetId": None}
     
     if not spreadsheetId:
-        return {
-            "successful": False,
-            "message": "Error: Spreadsheet ID must be specified",
-            "spreadsheetId": None,
-            "error": "Missing spreadsheet ID"
-        }
+        return _error_response("Error: Spreadsheet ID must be specified", "Missing spreadsheet ID")
     
     if not dataFilters:
-        return {
-            "successful": False,
-            "message": "Error: Data filters must be specified",
-            "spreadsheetId": None,
-            "error": "Missing data filters"
-        }
+        return _error_response("Error: Data filters must be specified", "Missing data filters")
     
     if not isinstance(dataFilters, list):
-        return {
-            "successful": False,
-            "message": "Error: Data filters must be an array",
-            "spreadsheetId": None,
-            "error": "Invalid data filters format"
-        }
+        return _error_response("Error: Data filters must be an array", "Invalid data filters format")
     
     if len(dataFilters) == 0:
-        return {
-            "successful": False,
-            "message": "Error: At least one data filter must be specified",
-            "spreadsheetId": None,
-            "error": "Empty data filters array"
-        }
+        return _error_response("Error: At least one data filter must be specified", "Empty data filters array")
+    
+    # A1 ranges that repeat or lie inside another range add nothing to the clear
+    kept_ranges = set(_minimal_a1_ranges([filter_item for filter_item in dataFilters if isinstance(filter_item, str)]))
     
     # Convert A1 notation strings to DataFilter objects if needed
     processed_data_filters = []
     for i, filter_item in enumerate(dataFilters):
         if isinstance(filter_item, str):
+            if filter_item not in kept_ranges:
+                continue
+            kept_ranges.discard(filter_item)
             # Convert A1 notation string to DataFilter object
             processed_data_filters.append({
                 'a1Range': filter_item
@@ -5607,114 +6227,35 @@ async def batch_clear_values_by_data_filter(spreadsheetId: str, dataFilters: lis
             # Already a DataFilter object
             processed_data_filters.append(filter_item)
         else:
-            return {
-                "successful": False,
-                "message": f"Error: Data filter at index {i} must be a string or object",
-                "spreadsheetId": None,
-                "error": f"Invalid data filter type at index {i}"
-            }
+            return _error_response(f"Error: Data filter at index {i} must be a string or object", f"Invalid data filter type at index {i}")
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
-        # Validate spreadsheet exists
+        # Clear values using data filters, looking up the title alongside it (cached for later calls).
+        # A missing spreadsheet surfaces as a 404 from the operation itself.
         try:
-            spreadsheet_info = service.spreadsheets().get(
-                spreadsheetId=spreadsheetId,
-                ranges=[],
-                includeGridData=False
-            ).execute()
-        except Exception as e:
-            return {
-                "successful": False,
-                "message": f"Error accessing spreadsheet: {str(e)}",
-                "spreadsheetId": spreadsheetId,
-                "error": str(e)
-            }
-        
-        # Get spreadsheet title
-        spreadsheet_title = spreadsheet_info.get('properties', {}).get('title', 'Unknown')
-        
-        # Clear values using data filters
-        try:
-            response = service.spreadsheets().values().batchClearByDataFilter(
-                spreadsheetId=spreadsheetId,
-                body={
-                    'dataFilters': processed_data_filters
-                }
-            ).execute()
+            response, spreadsheet_title = await asyncio.gather(
+                _execute(service.spreadsheets().values().batchClearByDataFilter(
+                    spreadsheetId=spreadsheetId,
+                    body={
+                        'dataFilters': processed_data_filters
+                    }
+                )),
+                _get_spreadsheet_title(service, spreadsheetId)
+            )
         except Exception as e:
-            return {
-                "successful": False,
-                "message": f"Error clearing values by data filter: {str(e)}",
-                "spreadsheetId": spreadsheetId,
-                "error": str(e)
-            }
+            if _is_not_found(e):
+                return _error_response(f"Error accessing spreadsheet: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
+            return _error_response(f"Error clearing values by data filter: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
         
         # Extract response data
         cleared_ranges = response.get('clearedRanges', [])
         spreadsheet_id_response = response.get('spreadsheetId', spreadsheetId)
         
         # Count total cells cleared
-        total_cells_cleared = 0
-        range_details = []
-        
-        for cleared_range in cleared_ranges:
-            # Parse the range to estimate cell count
-            try:
-                # Extract sheet name and range
-                if '!' in cleared_range:
-                    sheet_part, range_part = cleared_range.split('!', 1)
-                    sheet_name = sheet_part.strip("'")
-                else:
-                    sheet_name = "Sheet1"  # Default sheet
-                    range_part = cleared_range
-                
-                # Parse range to get dimensions
-                if ':' in range_part:
-                    start_cell, end_cell = range_part.split(':')
-                    
-                    # Convert A1 notation to row/column indices
-                    def parse_cell(cell):
-                        import re
-                        match = re.match(r'([A-Z]+)(\d+)', cell.upper())
-                        if match:
-                            col_str, row_str = match.groups()
-                            # Convert column letters to number
-                            col_num = 0
-                            for char in col_str:
-                                col_num = col_num * 26 + (ord(char) - ord('A') + 1)
-                            return int(row_str), col_num
-                        return 1, 1
-                    
-                    start_row, start_col = parse_cell(start_cell)
-                    end_row, end_col = parse_cell(end_cell)
-                    
-                    # Calculate cell count
-                    rows = end_row - start_row + 1
-                    cols = end_col - start_col + 1
-                    cells_in_range = rows * cols
-                else:
-                    # Single cell
-                    cells_in_range = 1
-                
-                total_cells_cleared += cells_in_range
-                
-                range_details.append({
-                    "range": cleared_range,
-                    "sheet_name": sheet_name,
-                    "estimated_cells": cells_in_range
-                })
-                
-            except Exception:
-                # If parsing fails, assume at least 1 cell
-                total_cells_cleared += 1
-                range_details.append({
-                    "range": cleared_range,
-                    "sheet_name": "Unknown",
-                    "estimated_cells": 1
-                })
+        range_details, total_cells_cleared = _cleared_range_details(cleared_ranges)
         
         return {
             "successful": True,
@@ -5736,16 +6277,11 @@ async def batch_clear_values_by_data_filter(spreadsheetId: str, dataFilters: lis
         }
         
     except Exception as e:
-        return {
-            "successful": False,
-            "message": f"Error batch clearing values by data filter: {str(e)}",
-            "spreadsheetId": spreadsheetId,
-            "error": str(e)
-        }
+        return _error_response(f"Error batch clearing values by data filter: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
 
 
 @simple_mcp.tool()
-async def batch_get_spreadsheet_values_by_data_filter(spreadsheetId: str, dataFilters: list, majorDimension: str = "ROWS", valueRenderOption: str = "UNFORMATTED_VALUE", dateTimeRenderOption: str = "SERIAL_NUMBER") -> dict:
+async def batch_get_spreadsheet_values_by_data_filter(spreadsheetId: str, dataFilters: list, majorDimension: str = "ROWS", valueRenderOption: str = "UNFORMATTED_VALUE", dateTimeRenderOption: str = "SERIAL_NUMBER", include_values_inline: bool = True) -> dict:
     """Return one or more ranges of values from a spreadsheet that match the specified data filters.
     
     Tool to return one or more ranges of values from a spreadsheet that match the specified data filters. 
@@ -5757,80 +6293,34 @@ async def batch_get_spreadsheet_values_by_data_filter(spreadsheetId: str, dataFi
         majorDimension: The major dimension of the values
         valueRenderOption: Determines how values in the response should be rendered
         dateTimeRenderOption: Determines how dates, times, and durations in the response should be rendered
+        include_values_inline: Whether to return each range's values in range_details. Set to False
+                               to get only the shape (rows, columns, cells) of each matched range.
     """
     # Check credentials first
     creds_valid, error_msg = check_credentials()
     if not creds_valid:
-        error_response = get_auth_error_response()
-        return {
-            "successful": False,
-            "message": error_response["message"],
-            "error": error_response["error"],
-            "instructions": error_response["instructions"],
-            "spreadsheetId": None
-        }
-    
-    if not spreadsheetId:
-        return {
-            "successful": False,
-            "message": "Error: Spreadsheet ID must be specified",
-            "spreadsheetId": None,
-            "error": "Missing spreadsheet ID"
-        }
+        return {**get_auth_error_response(), "spreadsheetId": None}
     
-    if not dataFilters:
-        return {
-            "successful": False,
-            "message": "Error: Data filters must be specified",
-            "spreadsheetId": None,
-            "error": "Missing data filters"
-        }
-    
-    if not isinstance(dataFilters, list):
-        return {
-            "successful": False,
-            "message": "Error: Data filters must be an array",
-            "spreadsheetId": None,
-            "error": "Invalid data filters format"
-        }
-    
-    if len(dataFilters) == 0:
-        return {
-            "successful": False,
-            "message": "Error: At least one data filter must be specified",
-            "spreadsheetId": None,
-            "error": "Empty data filters array"
-        }
+    if not spreadsheetId:
+        return _error_response("Error: Spreadsheet ID must be specified", "Missing spreadsheet ID")
     
-    # Validate majorDimension
-    valid_major_dimensions = ["ROWS", "COLUMNS"]
-    if majorDimension not in valid_major_dimensions:
-        return {
-            "successful": False,
-            "message": f"Error: majorDimension must be one of {valid_major_dimensions}",
-            "spreadsheetId": None,
-            "error": f"Invalid majorDimension: {majorDimension}"
-        }
+    if not dataFilters:
+        return _error_response("Error: Data filters must be specified", "Missing data filters")
     
-    # Validate valueRenderOption
-    valid_value_render_options = ["FORMATTED_VALUE", "UNFORMATTED_VALUE", "FORMULA"]
-    if valueRenderOption not in valid_value_render_options:
-        return {
-            "successful": False,
-            "message": f"Error: valueRenderOption must be one of {valid_value_render_options}",
-            "spreadsheetId": None,
-            "error": f"Invalid valueRenderOption: {valueRenderOption}"
-        }
+    if not isinstance(dataFilters, list):
+        return _error_response("Error: Data filters must be an array", "Invalid data filters format")
     
-    # Validate dateTimeRenderOption
-    valid_datetime_render_options = ["SERIAL_NUMBER", "FORMATTED_STRING"]
-    if dateTimeRenderOption not in valid_datetime_render_options:
-        return {
-            "successful": False,
-            "message": f"Error: dateTimeRenderOption must be one of {valid_datetime_render_options}",
-            "spreadsheetId": None,
-            "error": f"Invalid dateTimeRenderOption: {dateTimeRenderOption}"
-        }
+    if len(dataFilters) == 0:
+        return _error_response("Error: At least one data filter must be specified", "Empty data filters array")
+    
+    # Validate the enumerated options
+    invalid_option = _invalid_option_response((
+        ("majorDimension", majorDimension, _MAJOR_DIMENSIONS),
+        ("valueRenderOption", valueRenderOption, _VALUE_RENDER_OPTIONS),
+        ("dateTimeRenderOption", dateTimeRenderOption, _DATETIME_RENDER_OPTIONS)
+    ))
+    if invalid_option:
+        return invalid_option
     
     # Convert A1 notation strings to DataFilter objects if needed
     processed_data_filters = []
@@ -5844,53 +6334,31 @@ async def batch_get_spreadsheet_values_by_data_filter(spreadsheetId: str, dataFi
             # Already a DataFilter object
             processed_data_filters.append(filter_item)
         else:
-            return {
-                "successful": False,
-                "message": f"Error: Data filter at index {i} must be a string or object",
-                "spreadsheetId": None,
-                "error": f"Invalid data filter type at index {i}"
-            }
+            return _error_response(f"Error: Data filter at index {i} must be a string or object", f"Invalid data filter type at index {i}")
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
-        
-        # Validate spreadsheet exists
-        try:
-            spreadsheet_info = service.spreadsheets().get(
-                spreadsheetId=spreadsheetId,
-                ranges=[],
-                includeGridData=False
-            ).execute()
-        except Exception as e:
-            return {
-                "successful": False,
-                "message": f"Error accessing spreadsheet: {str(e)}",
-                "spreadsheetId": spreadsheetId,
-                "error": str(e)
-            }
-        
-        # Get spreadsheet title
-        spreadsheet_title = spreadsheet_info.get('properties', {}).get('title', 'Unknown')
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
-        # Get values using data filters
+        # Get values using data filters, looking up the title alongside it (cached for later calls).
+        # A missing spreadsheet surfaces as a 404 from the operation itself.
         try:
-            response = service.spreadsheets().values().batchGetByDataFilter(
-                spreadsheetId=spreadsheetId,
-                body={
-                    'dataFilters': processed_data_filters,
-                    'majorDimension': majorDimension,
-                    'valueRenderOption': valueRenderOption,
-                    'dateTimeRenderOption': dateTimeRenderOption
-                }
-            ).execute()
+            response, spreadsheet_title = await asyncio.gather(
+                _execute(service.spreadsheets().values().batchGetByDataFilter(
+                    spreadsheetId=spreadsheetId,
+                    body={
+                        'dataFilters': processed_data_filters,
+                        'majorDimension': majorDimension,
+                        'valueRenderOption': valueRenderOption,
+                        'dateTimeRenderOption': dateTimeRenderOption
+                    }
+                )),
+                _get_spreadsheet_title(service, spreadsheetId)
+            )
         except Exception as e:
-            return {
-                "successful": False,
-                "message": f"Error getting values by data filter: {str(e)}",
-                "spreadsheetId": spreadsheetId,
-                "error": str(e)
-            }
+            if _is_not_found(e):
+                return _error_response(f"Error accessing spreadsheet: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
+            return _error_response(f"Error getting values by data filter: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
         
         # Extract response data
         value_ranges = response.get('valueRanges', [])
@@ -5899,16 +6367,22 @@ async def batch_get_spreadsheet_values_by_data_filter(spreadsheetId: str, dataFi
         # Process the retrieved data
         total_ranges_retrieved = len(value_ranges)
         total_cells_retrieved = 0
+        total_rows = 0
+        max_columns = 0
         range_details = []
-        all_values = []
         
         for value_range in value_ranges:
             range_name = value_range.get('range', 'Unknown')
             values = value_range.get('valueRange', {}).get('values', [])
             
-            # Count cells in this range
-            cells_in_range = sum(len(row) for row in values) if values else 0
+            # Count rows, columns and cells in this range
+            rows_in_range = len(values)
+            columns_in_range = len(values[0]) if values else 0
+            cells_in_range = sum(map(len, values))
             total_cells_retrieved += cells_in_range
+            total_rows += rows_in_range
+            if columns_in_range > max_columns:
+                max_columns = columns_in_range
             
             # Extract sheet name from range
             sheet_name = "Unknown"
@@ -5919,14 +6393,11 @@ async def batch_get_spreadsheet_values_by_data_filter(spreadsheetId: str, dataFi
             range_details.append({
                 "range": range_name,
                 "sheet_name": sheet_name,
-                "rows": len(values),
-                "columns": len(values[0]) if values and len(values) > 0 else 0,
+                "rows": rows_in_range,
+                "columns": columns_in_range,
                 "cells": cells_in_range,
-                "values": values
+                "values": values if include_values_inline else None
             })
-            
-            # Add to all values
-            all_values.extend(values)
         
         return {
             "successful": True,
@@ -5939,7 +6410,6 @@ async def batch_get_spreadsheet_values_by_data_filter(spreadsheetId: str, dataFi
             "valueRenderOption": valueRenderOption,
             "dateTimeRenderOption": dateTimeRenderOption,
             "range_details": range_details,
-            "all_values": all_values,
             "data_filters_used": len(processed_data_filters),
             "web_view_link": f"https://docs.google.com/spreadsheets/d/{spreadsheet_id_response}/edit",
             "retrieval_details": {
@@ -5947,18 +6417,85 @@ async def batch_get_spreadsheet_values_by_data_filter(spreadsheetId: str, dataFi
                 "processed_data_filters": processed_data_filters,
                 "successful_ranges": [r["range"] for r in range_details],
                 "method": "data_filter_get",
-                "total_rows": sum(r["rows"] for r in range_details),
-                "total_columns": max(r["columns"] for r in range_details) if range_details else 0
+                "total_rows": total_rows,
+                "total_columns": max_columns
             }
         }
         
     except Exception as e:
-        return {
-            "successful": False,
-            "message": f"Error batch getting spreadsheet values by data filter: {str(e)}",
-            "spreadsheetId": spreadsheetId,
-            "error": str(e)
-        }
+        return _error_response(f"Error batch getting spreadsheet values by data filter: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
+
+
+# Property changes reported by the update_*_properties tools. Compared fields map to the value
+# shown when the original is missing and a template for the change; the sheet fields in
+# _SHEET_PROPERTY_UPDATES are reported whenever they are requested.
+_SHEET_PROPERTY_CHANGES = {
+    "title": ("Unknown", "Title: '{old}' → '{new}'"),
+    "hidden": (False, "Hidden: {old} → {new}"),
+    "index": (0, "Index: {old} → {new}"),
+}
+_SHEET_PROPERTY_UPDATES = {
+    "tabColorStyle": "Tab color updated",
+    "gridProperties": "Grid properties updated",
+}
+_SPREADSHEET_PROPERTY_CHANGES = {
+    "title": ("Unknown", "Title: '{old}' → '{new}'"),
+    "locale": ("Unknown", "Locale: {old} → {new}"),
+    "timeZone": ("Unknown", "Time Zone: {old} → {new}"),
+    "autoRecalc": ("Unknown", "Auto Recalc: {old} → {new}"),
+}
+
+@functools.lru_cache(maxsize=256)
+def _parse_fields(fields: str) -> tuple[str, ...]:
+    """Split a comma-separated field mask into its stripped, non-empty field names"""
+    return tuple(field for field in map(str.strip, fields.split(',')) if field)
+
+
+def _describe_property_changes(fields: list, properties: dict, original_properties: dict, compared: dict, updated: dict | None = None) -> list:
+    """Describe the requested fields whose new value differs from the original, in request order"""
+    changes = []
+    for field in fields:
+        if field not in properties:
+            continue
+        if field in compared:
+            new_value = properties[field]
+            if new_value != original_properties.get(field):
+                default, template = compared[field]
+                changes.append(template.format(old=original_properties.get(field, default), new=new_value))
+        elif updated and field in updated:
+            changes.append(updated[field])
+    return changes
+
+
+def _sheet_properties_update_error(update) -> tuple[str, str] | None:
+    """Validate an updateSheetProperties object, returning (message, error) for the first problem or None"""
+    if not update:
+        return "Error: Update sheet properties must be specified", "Missing update sheet properties"
+    
+    if not isinstance(update, dict):
+        return "Error: Update sheet properties must be an object", "Invalid update sheet properties format"
+    
+    # Validate required fields in updateSheetProperties
+    if 'properties' not in update:
+        return "Error: 'properties' field is required in updateSheetProperties", "Missing properties field"
+    
+    if 'fields' not in update:
+        return "Error: 'fields' field is required in updateSheetProperties", "Missing fields field"
+    
+    if not update['properties']:
+        return "Error: Properties object cannot be empty", "Empty properties object"
+    
+    if not update['fields']:
+        return "Error: Fields string cannot be empty", "Empty fields string"
+    
+    # Validate that sheetId is present in properties
+    if 'sheetId' not in update['properties']:
+        return "Error: 'sheetId' is required in properties", "Missing sheetId in properties"
+    
+    if not isinstance(update['properties']['sheetId'], int):
+        return "Error: sheetId must be an integer", "Invalid sheetId type"
+    
+    return None
 
 
 @simple_mcp.tool()
@@ -6026,124 +6563,40 @@ async def update_sheet_properties(spreadsheetId: str, updateSheetProperties: dic
     # Check credentials first
     creds_valid, error_msg = check_credentials()
     if not creds_valid:
-        error_response = get_auth_error_response()
-        return {
-            "successful": False,
-            "message": error_response["message"],
-            "error": error_response["error"],
-            "instructions": error_response["instructions"],
-            "spreadsheetId": None
-        }
+        return {**get_auth_error_response(), "spreadsheetId": None}
     
     if not spreadsheetId:
-        return {
-            "successful": False,
-            "message": "Error: Spreadsheet ID must be specified",
-            "spreadsheetId": None,
-            "error": "Missing spreadsheet ID"
-        }
-    
-    if not updateSheetProperties:
-        return {
-            "successful": False,
-            "message": "Error: Update sheet properties must be specified",
-            "spreadsheetId": None,
-            "error": "Missing update sheet properties"
-        }
-    
-    if not isinstance(updateSheetProperties, dict):
-        return {
-            "successful": False,
-            "message": "Error: Update sheet properties must be an object",
-            "spreadsheetId": None,
-            "error": "Invalid update sheet properties format"
-        }
-    
-    # Validate required fields in updateSheetProperties
-    if 'properties' not in updateSheetProperties:
-        return {
-            "successful": False,
-            "message": "Error: 'properties' field is required in updateSheetProperties",
-            "spreadsheetId": None,
-            "error": "Missing properties field"
-        }
-    
-    if 'fields' not in updateSheetProperties:
-        return {
-            "successful": False,
-            "message": "Error: 'fields' field is required in updateSheetProperties",
-            "spreadsheetId": None,
-            "error": "Missing fields field"
-        }
-    
-    properties = updateSheetProperties.get('properties', {})
-    fields = updateSheetProperties.get('fields', '')
-    
-    if not properties:
-        return {
-            "successful": False,
-            "message": "Error: Properties object cannot be empty",
-            "spreadsheetId": None,
-            "error": "Empty properties object"
-        }
+        return _error_response("Error: Spreadsheet ID must be specified", "Missing spreadsheet ID")
     
-    if not fields:
-        return {
-            "successful": False,
-            "message": "Error: Fields string cannot be empty",
-            "spreadsheetId": None,
-            "error": "Empty fields string"
-        }
-    
-    # Validate that sheetId is present in properties
-    if 'sheetId' not in properties:
-        return {
-            "successful": False,
-            "message": "Error: 'sheetId' is required in properties",
-            "spreadsheetId": None,
-            "error": "Missing sheetId in properties"
-        }
+    invalid_update = _sheet_properties_update_error(updateSheetProperties)
+    if invalid_update:
+        return _error_response(*invalid_update)
     
-    sheet_id = properties.get('sheetId')
-    if not isinstance(sheet_id, int):
-        return {
-            "successful": False,
-            "message": "Error: sheetId must be an integer",
-            "spreadsheetId": None,
-            "error": "Invalid sheetId type"
-        }
+    properties = updateSheetProperties['properties']
+    fields = updateSheetProperties['fields']
+    sheet_id = properties['sheetId']
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
         # Validate spreadsheet exists and get current sheet info
         try:
-            spreadsheet_info = service.spreadsheets().get(
+            spreadsheet_info = await _execute(service.spreadsheets().get(
                 spreadsheetId=spreadsheetId,
-                ranges=[],
-                includeGridData=False
-            ).execute()
+                fields='properties.title,sheets.properties'
+            ))
         except Exception as e:
-            return {
-                "successful": False,
-                "message": f"Error accessing spreadsheet: {str(e)}",
-                "spreadsheetId": spreadsheetId,
-                "error": str(e)
-            }
+            return _error_response(f"Error accessing spreadsheet: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
         
         # Find the sheet to update
-        target_sheet = None
-        original_properties = {}
-        for sheet in spreadsheet_info.get('sheets', []):
-            if sheet['properties']['sheetId'] == sheet_id:
-                target_sheet = sheet
-                original_properties = sheet['properties'].copy()
-                break
+        sheets = spreadsheet_info.get('sheets', [])
+        sheets_by_id = {sheet['properties']['sheetId']: sheet for sheet in sheets}
+        target_sheet = sheets_by_id.get(sheet_id)
         
         if not target_sheet:
             available_sheets = [f"{sheet['properties']['title']} (ID: {sheet['properties']['sheetId']})" 
-                              for sheet in spreadsheet_info.get('sheets', [])]
+                              for sheet in sheets]
             return {
                 "successful": False,
                 "message": f"Sheet with ID {sheet_id} not found in spreadsheet",
@@ -6154,75 +6607,40 @@ async def update_sheet_properties(spreadsheetId: str, updateSheetProperties: dic
         
         # Get spreadsheet title
         spreadsheet_title = spreadsheet_info.get('properties', {}).get('title', 'Unknown')
+        original_properties = target_sheet['properties']
         original_sheet_title = original_properties.get('title', 'Unknown')
         
-        # Update the sheet properties
+        # Update the sheet properties, getting the updated sheet properties back in the same response
         try:
-            response = service.spreadsheets().batchUpdate(
+            response = await _execute(service.spreadsheets().batchUpdate(
                 spreadsheetId=spreadsheetId,
                 body={
                     'requests': [
                         {
                             'updateSheetProperties': updateSheetProperties
                         }
-                    ]
-                }
-            ).execute()
+                    ],
+                    'includeSpreadsheetInResponse': True,
+                    'responseIncludeGridData': False
+                },
+                fields='updatedSpreadsheet.sheets.properties'
+            ))
+            _invalidate_spreadsheet_meta(spreadsheetId)
         except Exception as e:
-            return {
-                "successful": False,
-                "message": f"Error updating sheet properties: {str(e)}",
-                "spreadsheetId": spreadsheetId,
-                "error": str(e)
-            }
+            return _error_response(f"Error updating sheet properties: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
         
-        # Get updated spreadsheet info to see the changes
-        try:
-            updated_spreadsheet_info = service.spreadsheets().get(
-                spreadsheetId=spreadsheetId,
-                ranges=[],
-                includeGridData=False
-            ).execute()
-            
-            # Find the updated sheet
-            updated_sheet = None
-            for sheet in updated_spreadsheet_info.get('sheets', []):
-                if sheet['properties']['sheetId'] == sheet_id:
-                    updated_sheet = sheet
-                    break
-            
-            updated_properties = updated_sheet['properties'] if updated_sheet else {}
-            
-        except Exception:
-            # If we can't get updated info, use the original properties
-            updated_properties = original_properties
+        # Find the updated sheet in the response, falling back to the original properties if it's missing
+        updated_properties = next(
+            (sheet['properties'] for sheet in response.get('updatedSpreadsheet', {}).get('sheets', [])
+             if sheet.get('properties', {}).get('sheetId') == sheet_id),
+            original_properties
+        )
         
         # Determine what was updated
-        updated_fields = fields.split(',')
-        changes_made = []
-        
-        for field in updated_fields:
-            field = field.strip()
-            if field == 'title' and 'title' in properties:
-                new_title = properties.get('title')
-                if new_title != original_properties.get('title'):
-                    changes_made.append(f"Title: '{original_properties.get('title', 'Unknown')}' → '{new_title}'")
-            
-            elif field == 'hidden' and 'hidden' in properties:
-                new_hidden = properties.get('hidden')
-                if new_hidden != original_properties.get('hidden'):
-                    changes_made.append(f"Hidden: {original_properties.get('hidden', False)} → {new_hidden}")
-            
-            elif field == 'index' and 'index' in properties:
-                new_index = properties.get('index')
-                if new_index != original_properties.get('index'):
-                    changes_made.append(f"Index: {original_properties.get('index', 0)} → {new_index}")
-            
-            elif field == 'tabColorStyle' and 'tabColorStyle' in properties:
-                changes_made.append("Tab color updated")
-            
-            elif field == 'gridProperties' and 'gridProperties' in properties:
-                changes_made.append("Grid properties updated")
+        updated_fields = _parse_fields(fields)
+        changes_made = _describe_property_changes(
+            updated_fields, properties, original_properties, _SHEET_PROPERTY_CHANGES, _SHEET_PROPERTY_UPDATES
+        )
         
         return {
             "successful": True,
@@ -6233,7 +6651,7 @@ async def update_sheet_properties(spreadsheetId: str, updateSheetProperties: dic
             "original_sheet_title": original_sheet_title,
             "updated_sheet_title": updated_properties.get('title', original_sheet_title),
             "changes_made": changes_made,
-            "fields_updated": updated_fields,
+            "fields_updated": list(updated_fields),
             "web_view_link": f"https://docs.google.com/spreadsheets/d/{spreadsheetId}/edit",
             "update_details": {
                 "original_properties": original_properties,
@@ -6244,12 +6662,103 @@ async def update_sheet_properties(spreadsheetId: str, updateSheetProperties: dic
         }
         
     except Exception as e:
+        return _error_response(f"Error updating sheet properties: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
+
+
+@simple_mcp.tool()
+async def update_sheet_properties_bulk(spreadsheetId: str, updates: list) -> dict:
+    """Update properties of several sheets (worksheets) within a google spreadsheet in one request.
+    
+    Tool to update the title, index, visibility, tab color, or grid properties of several sheets at once.
+    use this instead of calling update_sheet_properties repeatedly; all updates are sent in a single
+    batch update, so they are applied together or not at all.
+    
+    Args:
+        spreadsheetId: The ID of the spreadsheet containing the sheets to update
+        updates: Array of update objects, each shaped like the updateSheetProperties argument of
+                 update_sheet_properties (an object with "properties", including "sheetId", and "fields")
+    
+    Example input:
+    {
+        "spreadsheetId": "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms",
+        "updates": [
+            {"properties": {"sheetId": 0, "title": "Summary"}, "fields": "title"},
+            {"properties": {"sheetId": 1234567890, "hidden": true}, "fields": "hidden"}
+        ]
+    }
+    """
+    # Check credentials first
+    creds_valid, error_msg = check_credentials()
+    if not creds_valid:
+        return {**get_auth_error_response(), "spreadsheetId": None}
+    
+    if not spreadsheetId:
+        return _error_response("Error: Spreadsheet ID must be specified", "Missing spreadsheet ID")
+    
+    if not updates:
+        return _error_response("Error: Updates must be specified", "Missing updates")
+    
+    if not isinstance(updates, list):
+        return _error_response("Error: Updates must be an array", "Invalid updates format")
+    
+    # Validate every update before sending any of them
+    for i, update in enumerate(updates):
+        invalid_update = _sheet_properties_update_error(update)
+        if invalid_update:
+            message, error = invalid_update
+            return _error_response(f"Error: Update at index {i}: {message.removeprefix('Error: ')}", f"{error} at index {i}")
+    
+    try:
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
+        
+        # Apply all updates in one batch update, getting the updated sheet properties back in the same response
+        try:
+            response = await _execute(service.spreadsheets().batchUpdate(
+                spreadsheetId=spreadsheetId,
+                body={
+                    'requests': [{'updateSheetProperties': update} for update in updates],
+                    'includeSpreadsheetInResponse': True,
+                    'responseIncludeGridData': False
+                },
+                fields='updatedSpreadsheet.properties.title,updatedSpreadsheet.sheets.properties'
+            ))
+            _invalidate_spreadsheet_meta(spreadsheetId)
+        except Exception as e:
+            if _is_not_found(e):
+                return _error_response(f"Error accessing spreadsheet: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
+            return _error_response(f"Error updating sheet properties: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
+        
+        updated_spreadsheet = response.get('updatedSpreadsheet', {})
+        spreadsheet_title = updated_spreadsheet.get('properties', {}).get('title', 'Unknown')
+        updated_sheets = {sheet['properties']['sheetId']: sheet['properties'] for sheet in updated_spreadsheet.get('sheets', [])}
+        
+        # Report each update with the sheet's properties after the batch
+        results = []
+        for update in updates:
+            sheet_id = update['properties']['sheetId']
+            results.append({
+                "sheet_id": sheet_id,
+                "fields_updated": list(_parse_fields(update['fields'])),
+                "updated_properties": updated_sheets.get(sheet_id, {})
+            })
+        
         return {
-            "successful": False,
-            "message": f"Error updating sheet properties: {str(e)}",
+            "successful": True,
+            "message": f"Successfully applied {len(updates)} sheet property update(s) in spreadsheet '{spreadsheet_title}'",
             "spreadsheetId": spreadsheetId,
-            "error": str(e)
+            "spreadsheet_title": spreadsheet_title,
+            "total_updates": len(updates),
+            "results": results,
+            "web_view_link": f"https://docs.google.com/spreadsheets/d/{spreadsheetId}/edit"
         }
+        
+    except Exception as e:
+        return _error_response(f"Error updating sheet properties: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
+
+
+# Allowed values of the spreadsheet autoRecalc property
+_AUTO_RECALC_VALUES = ("RECALCULATION_NEVER", "ON_CHANGE", "MINUTE")
 
 
 @simple_mcp.tool()
@@ -6307,102 +6816,53 @@ async def update_spreadsheet_properties(spreadsheetId: str, properties: dict, fi
     # Check credentials first
     creds_valid, error_msg = check_credentials()
     if not creds_valid:
-        error_response = get_auth_error_response()
-        return {
-            "successful": False,
-            "message": error_response["message"],
-            "error": error_response["error"],
-            "instructions": error_response["instructions"],
-            "spreadsheetId": None
-        }
+        return {**get_auth_error_response(), "spreadsheetId": None}
     
     if not spreadsheetId:
-        return {
-            "successful": False,
-            "message": "Error: Spreadsheet ID must be specified",
-            "spreadsheetId": None,
-            "error": "Missing spreadsheet ID"
-        }
+        return _error_response("Error: Spreadsheet ID must be specified", "Missing spreadsheet ID")
     
     if not properties:
-        return {
-            "successful": False,
-            "message": "Error: Properties must be specified",
-            "spreadsheetId": None,
-            "error": "Missing properties"
-        }
+        return _error_response("Error: Properties must be specified", "Missing properties")
     
     if not isinstance(properties, dict):
-        return {
-            "successful": False,
-            "message": "Error: Properties must be an object",
-            "spreadsheetId": None,
-            "error": "Invalid properties format"
-        }
+        return _error_response("Error: Properties must be an object", "Invalid properties format")
     
     if not fields:
-        return {
-            "successful": False,
-            "message": "Error: Fields must be specified",
-            "spreadsheetId": None,
-            "error": "Missing fields"
-        }
+        return _error_response("Error: Fields must be specified", "Missing fields")
     
     if not isinstance(fields, str):
-        return {
-            "successful": False,
-            "message": "Error: Fields must be a string",
-            "spreadsheetId": None,
-            "error": "Invalid fields format"
-        }
+        return _error_response("Error: Fields must be a string", "Invalid fields format")
     
     # Validate fields string
     if not fields.strip():
-        return {
-            "successful": False,
-            "message": "Error: Fields string cannot be empty",
-            "spreadsheetId": None,
-            "error": "Empty fields string"
-        }
+        return _error_response("Error: Fields string cannot be empty", "Empty fields string")
     
     # Validate autoRecalc value if present
     if 'autoRecalc' in properties:
-        valid_auto_recalc_values = ["RECALCULATION_NEVER", "ON_CHANGE", "MINUTE"]
         auto_recalc_value = properties.get('autoRecalc')
-        if auto_recalc_value not in valid_auto_recalc_values:
-            return {
-                "successful": False,
-                "message": f"Error: autoRecalc must be one of {valid_auto_recalc_values}",
-                "spreadsheetId": None,
-                "error": f"Invalid autoRecalc value: {auto_recalc_value}"
-            }
+        if auto_recalc_value not in _AUTO_RECALC_VALUES:
+            return _error_response(f"Error: autoRecalc must be one of {list(_AUTO_RECALC_VALUES)}", f"Invalid autoRecalc value: {auto_recalc_value}")
     
     try:
-        # Build the Sheets service
-        service = build('sheets', 'v4', credentials=creds)
+        # Get the Sheets service
+        service = get_service('sheets', 'v4')
         
-        # Get current spreadsheet info to compare with
+        # Get the current spreadsheet properties to compare with
         try:
-            original_spreadsheet_info = service.spreadsheets().get(
+            original_spreadsheet_info = await _execute(service.spreadsheets().get(
                 spreadsheetId=spreadsheetId,
-                ranges=[],
-                includeGridData=False
-            ).execute()
+                fields='properties'
+            ))
         except Exception as e:
-            return {
-                "successful": False,
-                "message": f"Error accessing spreadsheet: {str(e)}",
-                "spreadsheetId": spreadsheetId,
-                "error": str(e)
-            }
+            return _error_response(f"Error accessing spreadsheet: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
         
         # Get original properties
         original_properties = original_spreadsheet_info.get('properties', {})
         original_title = original_properties.get('title', 'Unknown')
         
-        # Update the spreadsheet properties
+        # Update the spreadsheet properties, getting the updated properties back in the same response
         try:
-            response = service.spreadsheets().batchUpdate(
+            response = await _execute(service.spreadsheets().batchUpdate(
                 spreadsheetId=spreadsheetId,
                 body={
                     'requests': [
@@ -6412,55 +6872,22 @@ async def update_spreadsheet_properties(spreadsheetId: str, properties: dict, fi
                                 'fields': fields
                             }
                         }
-                    ]
-                }
-            ).execute()
+                    ],
+                    'includeSpreadsheetInResponse': True,
+                    'responseIncludeGridData': False
+                },
+                fields='updatedSpreadsheet.properties'
+            ))
+            _invalidate_spreadsheet_meta(spreadsheetId)
         except Exception as e:
-            return {
-                "successful": False,
-                "message": f"Error updating spreadsheet properties: {str(e)}",
-                "spreadsheetId": spreadsheetId,
-                "error": str(e)
-            }
+            return _error_response(f"Error updating spreadsheet properties: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
         
-        # Get updated spreadsheet info to see the changes
-        try:
-            updated_spreadsheet_info = service.spreadsheets().get(
-                spreadsheetId=spreadsheetId,
-                ranges=[],
-                includeGridData=False
-            ).execute()
-            
-            updated_properties = updated_spreadsheet_info.get('properties', {})
-            
-        except Exception:
-            # If we can't get updated info, use the original properties
-            updated_properties = original_properties
+        # Fall back to the original properties if the response doesn't carry the updated ones
+        updated_properties = response.get('updatedSpreadsheet', {}).get('properties') or original_properties
         
         # Determine what was updated
-        updated_fields = [field.strip() for field in fields.split(',')]
-        changes_made = []
-        
-        for field in updated_fields:
-            if field == 'title' and 'title' in properties:
-                new_title = properties.get('title')
-                if new_title != original_properties.get('title'):
-                    changes_made.append(f"Title: '{original_properties.get('title', 'Unknown')}' → '{new_title}'")
-            
-            elif field == 'locale' and 'locale' in properties:
-                new_locale = properties.get('locale')
-                if new_locale != original_properties.get('locale'):
-                    changes_made.append(f"Locale: {original_properties.get('locale', 'Unknown')} → {new_locale}")
-            
-            elif field == 'timeZone' and 'timeZone' in properties:
-                new_timezone = properties.get('timeZone')
-                if new_timezone != original_properties.get('timeZone'):
-                    changes_made.append(f"Time Zone: {original_properties.get('timeZone', 'Unknown')} → {new_timezone}")
-            
-            elif field == 'autoRecalc' and 'autoRecalc' in properties:
-                new_auto_recalc = properties.get('autoRecalc')
-                if new_auto_recalc != original_properties.get('autoRecalc'):
-                    changes_made.append(f"Auto Recalc: {original_properties.get('autoRecalc', 'Unknown')} → {new_auto_recalc}")
+        updated_fields = _parse_fields(fields)
+        changes_made = _describe_property_changes(updated_fields, properties, original_properties, _SPREADSHEET_PROPERTY_CHANGES)
         
         return {
             "successful": True,
@@ -6469,7 +6896,7 @@ async def update_spreadsheet_properties(spreadsheetId: str, properties: dict, fi
             "original_title": original_title,
             "updated_title": updated_properties.get('title', original_title),
             "changes_made": changes_made,
-            "fields_updated": updated_fields,
+            "fields_updated": list(updated_fields),
             "web_view_link": f"https://docs.google.com/spreadsheets/d/{spreadsheetId}/edit",
             "update_details": {
                 "original_properties": original_properties,
@@ -6480,12 +6907,7 @@ async def update_spreadsheet_properties(spreadsheetId: str, properties: dict, fi
         }
         
     except Exception as e:
-        return {
-            "successful": False,
-            "message": f"Error updating spreadsheet properties: {str(e)}",
-            "spreadsheetId": spreadsheetId,
-            "error": str(e)
-        }
+        return _error_response(f"Error updating spreadsheet properties: {str(e)}", str(e), spreadsheet_id=spreadsheetId)
 
 
 @simple_mcp.tool()